@@ -3,7 +3,8 @@ import re
 import sys
 import json
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, Tag
 import cssutils
 from cssutils.css import CSSRule
 import pyjsparser
@@ -16,20 +17,239 @@ import subprocess
 import os
 import re
 import csv
+import io
 import base64
 import math
 import mimetypes
 import html
+import types
+import time
+import threading
+import socket
+import sqlite3
+import hashlib
+import asyncio
+import aiohttp
+import bisect
+from functools import lru_cache
+from collections import OrderedDict, Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
 try:
     import subprocess
 except ImportError:
     subprocess = None
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import quickjs
+except ImportError:
+    quickjs = None
+
+try:
+    import esprima
+except ImportError:
+    esprima = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import tinycss2
+except ImportError:
+    tinycss2 = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj, indent=2)
+
+# --- Precompiled patterns for the per-file analyzers ---
+_RE_SYNC_XHR = re.compile(r'open\s*\(\s*["\']\w+["\']\s*,\s*[^,]++,\s*false')
+_RE_MODERN_JS = re.compile(r'=>|\bconst\b|\blet\b|\bclass\b|\bimport\b|\bexport\b')
+_RE_JS_SCAN = re.compile(f'(?P<xhr>{_RE_SYNC_XHR.pattern})|(?P<modern>{_RE_MODERN_JS.pattern})')
+# Literal substrings every match of the patterns above contains; if none occur the regex can't match
+_MODERN_JS_TOKENS = ('=>', 'const', 'let', 'class', 'import', 'export')
+_RE_PKG_VER = re.compile(r'^[<>=~]?(?P<maj>\d+)\.(?P<min>\d+)\.\d+$')
+_OLD_PKG_MAJOR_MINOR = {('1', '0'), ('2', '0')}
+_ENV_SECRET_KEYS = ('key', 'token', 'secret', 'password', 'api')
+_RE_REACT_KEY = re.compile(r'<\w+\s+key=[^\s>]+')
+_RE_MAP = re.compile(r'\.map\(')
+_RE_LIFECYCLE = re.compile(r'componentWillMount|componentWillReceiveProps|componentWillUpdate')
+_RE_DIRECT_DOM = re.compile(r'document\.getElementById|document\.querySelector')
+_RE_NGFOR = re.compile(r'\*ngFor(?!.*trackBy)')
+_RE_FLAKE8_LINE = re.compile(r'^(.*):(\d+):(\d+): ([A-Z]\d+) (.*)$')
+_RE_FLASK_SECRET = re.compile(r'SECRET_KEY\s*=\s*["\'][^"\']++["\']')
+_RE_PHP_MYSQL = re.compile(r'mysql_\w++\(')
+_RE_PHP_INPUT = re.compile(r'\$_(GET|POST|REQUEST|COOKIE)\[')
+_RE_PHP_SANITIZE = re.compile(r'htmlspecialchars|filter_var')
+_TEXT_PATTERNS = [
+    (re.compile(r'TODO|FIXME', re.I), 'TODO or FIXME found', 'TEXT_TODO_FIXME'),
+    (re.compile(r'(password|secret|token|key)[^=]*+=', re.I), 'Possible secret or password assignment', 'TEXT_POTENTIAL_SECRET'),
+    (re.compile(r'\bdebug\b', re.I), 'Debug flag found', 'TEXT_DEBUG_FLAG'),
+]
+# Dangerous calls and deprecated APIs: (group name, pattern, issue type, message)
+_JS_BAD = [
+    ('eval', r'\beval\s*\(', 'JS_DANGEROUS_FUNCTION', 'Use of eval detected'),
+    ('innerHTML', r'\.innerHTML\s*=', 'JS_DANGEROUS_FUNCTION', 'Use of innerHTML detected'),
+    ('docwrite', r'document\.write\s*\(', 'JS_DANGEROUS_FUNCTION', 'Use of document.write detected'),
+    ('escape', r'\bescape\(', 'JS_DEPRECATED_API', 'Deprecated API used: escape('),
+    ('unescape', r'\bunescape\(', 'JS_DEPRECATED_API', 'Deprecated API used: unescape('),
+    ('docall', r'document\.all', 'JS_DEPRECATED_API', 'Deprecated API used: document.all'),
+    ('doclayers', r'document\.layers', 'JS_DEPRECATED_API', 'Deprecated API used: document.layers'),
+]
+_JS_BAD_ISSUES = {name: (issue_type, message) for name, _, issue_type, message in _JS_BAD}
+# One alternation; the group name (m.lastgroup) selects the issue. RE2, if installed, scans in linear time
+_RE_JS_BAD = (re2 or re).compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern, _, _ in _JS_BAD))
+_HEADING_LEVELS = {f'h{level}': level for level in range(1, 7)}
+
+# --- Literal JS needles, matched in one pass (Aho-Corasick when available) ---
+JS_DEPRECATED_APIS = ('escape(', 'unescape(', 'document.all', 'document.layers')
+_JS_NEEDLES = JS_DEPRECATED_APIS + ('document.write',)
+if ahocorasick:
+    _JS_AC = ahocorasick.Automaton()
+    for _kw in _JS_NEEDLES:
+        _JS_AC.add_word(_kw, _kw)
+    _JS_AC.make_automaton()
+else:
+    _JS_AC = None
+_RE_JS_NEEDLES = re.compile('|'.join(map(re.escape, _JS_NEEDLES)))
+
+if hyperscan:
+    # Hyperscan compiles every pattern into one DFA; ids index _JS_BAD
+    _JS_BAD_DB = hyperscan.Database()
+    _JS_BAD_DB.compile(
+        expressions=[pattern.encode() for _, pattern, _, _ in _JS_BAD],
+        ids=list(range(len(_JS_BAD))),
+        elements=len(_JS_BAD),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_JS_BAD),
+    )
+else:
+    _JS_BAD_DB = None
+
+def scan_js_bad(content):
+    """Return (group name, matched text) for each dangerous/deprecated API use, in source order."""
+    if _JS_BAD_DB is None:
+        return [(m.lastgroup, m.group(0)) for m in _RE_JS_BAD.finditer(content)]
+    data = content.encode('utf-8', 'replace')
+    found = []
+    def on_match(pattern_id, start, end, flags, context):
+        found.append((start, _JS_BAD[pattern_id][0], data[start:end].decode('utf-8', 'replace')))
+    _JS_BAD_DB.scan(data, match_event_handler=on_match)
+    found.sort()
+    return [(name, snippet) for _, name, snippet in found]
+
+def find_js_needles(content):
+    if _JS_AC is not None:
+        return {kw for _, kw in _JS_AC.iter(content)}
+    hits = set(_RE_JS_NEEDLES.findall(content))
+    # The regex does not report overlapping matches; 'unescape(' also contains 'escape('
+    if 'unescape(' in hits:
+        hits.add('escape(')
+    return hits
+
+# --- DNS cache (pages hit the same few CDNs over and over) ---
+DNS_CACHE_TTL = 900
+_DNS_CACHE = OrderedDict()
+_DNS_CACHE_SIZE = 4096
+_DNS_CACHE_LOCK = threading.Lock()
+_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        hit = _DNS_CACHE.get(key)
+        if hit and hit[0] > now:
+            _DNS_CACHE.move_to_end(key)
+            return hit[1]
+    # Resolve outside the lock; a concurrent miss for the same host just resolves twice
+    result = _getaddrinfo(host, port, family, type, proto, flags)
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (now + DNS_CACHE_TTL, result)
+        _DNS_CACHE.move_to_end(key)
+        while len(_DNS_CACHE) > _DNS_CACHE_SIZE:
+            _DNS_CACHE.popitem(last=False)
+    return result
+
+def install_dns_cache():
+    """Route this process's socket.getaddrinfo through the cache.
+
+    urllib3 (requests) and aiohttp's threaded resolver both resolve through it. This patches
+    the process globally, so only the CLI and its own worker processes call it, never import.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+# --- Shared HTTP session (pooled keep-alive connections) ---
+HTTP_KEEPALIVE = 60
+HTTP_CACHE_NAME = '.analyzer_cache'
+# Bodies larger than this are not downloaded in full (or analyzed)
+MAX_FETCH_BYTES = 5 * 1024 * 1024
+FETCH_CHUNK_BYTES = 64 * 1024
+TOO_LARGE_MESSAGE = f'Response larger than {MAX_FETCH_BYTES} bytes; not analyzed'
+
+def read_capped(response, limit=MAX_FETCH_BYTES):
+    """Return the body of a streamed requests response, or None if it exceeds limit bytes."""
+    if int(response.headers.get('Content-Length') or 0) > limit:
+        return None
+    body = bytearray()
+    for chunk in response.iter_content(FETCH_CHUNK_BYTES):
+        body += chunk
+        if len(body) > limit:
+            return None
+    return bytes(body)
+
+def make_http_adapter():
+    return HTTPAdapter(pool_connections=64, pool_maxsize=128, max_retries=1)
+
+USER_AGENT = 'Mozilla/5.0 (compatible; StaticAnalyzer/2.0)'
+
+_SESSION = requests.Session()
+_SESSION.mount('http://', make_http_adapter())
+_SESSION.mount('https://', make_http_adapter())
+_SESSION.headers['User-Agent'] = USER_AGENT
+
 def is_absolute(url):
     return bool(urlparse(url).netloc)
 
+# Links that can never answer an HTTP probe
+SKIP_LINK_PREFIXES = ('#', 'mailto:', 'tel:', 'javascript:', 'data:')
+
+def is_non_http_link(href):
+    return href.lstrip().lower().startswith(SKIP_LINK_PREFIXES)
+
+def is_skipped_host(url, skip_hosts):
+    """True if url's host is one of skip_hosts or a subdomain of one."""
+    host = urlparse(url).hostname or ''
+    return any(host == h or host.endswith('.' + h) for h in skip_hosts)
+
 def fetch_url(session, url):
+    session = session or _SESSION
     try:
         response = session.get(url, timeout=10)
         response.raise_for_status()
@@ -38,108 +258,319 @@ def fetch_url(session, url):
         return None, str(e)
     return None, 'Unknown error'
 
+# --- Helpers for concurrent link checking ---
+# Hosts that reject or mishandle HEAD; probe them with a one-byte ranged GET instead
+HEAD_UNFRIENDLY_HOSTS = {'raw.githubusercontent.com', 'gist.githubusercontent.com'}
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+async def _probe(session, url):
+    if urlparse(url).hostname not in HEAD_UNFRIENDLY_HOSTS:
+        # No redirect chasing on the first hop; most links answer directly
+        async with session.head(url, allow_redirects=False, timeout=aiohttp.ClientTimeout(total=3)) as r:
+            status, location = r.status, r.headers.get('Location')
+        if status in _REDIRECT_STATUSES and location:
+            url = urljoin(url, location)
+            hit = _HEAD_CACHE.get(url)
+            if hit and hit[0] > time.monotonic() and hit[1][1] is None:
+                return hit[1][0]
+            async with session.head(url, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)) as r:
+                status = r.status
+        if status not in (405, 501):
+            return status
+    async with session.get(url, headers={'Range': 'bytes=0-0'}, timeout=aiohttp.ClientTimeout(total=5)) as r:
+        return r.status
+
+async def _head(session, url, sem):
+    async with sem:
+        try:
+            return url, await _probe(session, url), None
+        except Exception as e:
+            return url, None, str(e) or e.__class__.__name__
+
+async def _get(session, url, sem):
+    async with sem:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as r:
+                r.raise_for_status()
+                if (r.content_length or 0) > MAX_FETCH_BYTES:
+                    return url, None, TOO_LARGE_MESSAGE
+                body = bytearray()
+                async for chunk in r.content.iter_chunked(FETCH_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) > MAX_FETCH_BYTES:
+                        return url, None, TOO_LARGE_MESSAGE
+                return url, body.decode(r.charset or 'utf-8', errors='replace'), None
+        except Exception as e:
+            return url, None, str(e) or e.__class__.__name__
+
+async def _gather(urls, concurrency=64, headers=None, fetch=_head):
+    sem = asyncio.Semaphore(concurrency)
+    # A low per-host limit keeps a page full of same-site links from tripping rate limiting
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=DNS_CACHE_TTL,
+                                     keepalive_timeout=HTTP_KEEPALIVE)
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(*[fetch(session, u, sem) for u in urls])
+
+def fetch_urls(urls, headers=None):
+    """GET all unique URLs concurrently and return {url: (text, error)}."""
+    urls = set(urls)
+    if not urls:
+        return {}
+    return {url: (text, error) for url, text, error in asyncio.run(_gather(urls, headers=headers, fetch=_get))}
+
+# Stylesheets/scripts shared by the pages of one run (site bundles, CDN libraries) are downloaded once
+_ASSET_CACHE = OrderedDict()
+_ASSET_CACHE_LOCK = threading.Lock()
+ASSET_CACHE_CHARS = 64 * 1024 * 1024
+_asset_cache_chars = 0
+
+def cache_asset(url, content):
+    global _asset_cache_chars
+    with _ASSET_CACHE_LOCK:
+        if url in _ASSET_CACHE or len(content) > ASSET_CACHE_CHARS:
+            return
+        _ASSET_CACHE[url] = content
+        _asset_cache_chars += len(content)
+        while _asset_cache_chars > ASSET_CACHE_CHARS:
+            _, evicted = _ASSET_CACHE.popitem(last=False)
+            _asset_cache_chars -= len(evicted)
+
+def fetch_assets(urls, headers=None):
+    """fetch_urls() for page assets, served from the run-wide asset cache where possible."""
+    urls = set(urls)
+    with _ASSET_CACHE_LOCK:
+        results = {url: (_ASSET_CACHE[url], None) for url in urls if url in _ASSET_CACHE}
+    fetched = fetch_urls(urls - results.keys(), headers=headers)
+    for url, (content, error) in fetched.items():
+        if error is None and content is not None:
+            cache_asset(url, content)
+    results.update(fetched)
+    return results
+
+# Results outlive a single page so links shared across a repo are probed once
+_HEAD_CACHE = OrderedDict()
+_HEAD_CACHE_SIZE = 10000
+_HEAD_CACHE_LOCK = threading.Lock()
+HEAD_CACHE_TTL = 600
+# URLs being probed right now, so pages analyzed concurrently wait for one probe instead of repeating it
+_HEAD_IN_FLIGHT = {}
+# Signed/session URLs are unique per visit (and may expire), so their results are not reused
+_RE_SESSION_QUERY = re.compile(r'(?:^|[?&;])[^=&;]*(?:sess|sid|token|sig|auth|nonce|expires)[^=&;]*=', re.I)
+
+def is_session_scoped(url):
+    parsed = urlparse(url)
+    return bool(_RE_SESSION_QUERY.search(parsed.query) or _RE_SESSION_QUERY.search(parsed.params))
+
+# --http-cache also keeps HEAD results on disk, so the next run skips links checked recently
+HEAD_DB_NAME = '.analyzer_heads.sqlite'
+HEAD_DB_TTL = 24 * 3600
+_HEAD_DB_PATH = None
+# One connection per process: repo-mode workers must not share the parent's sqlite handle
+_HEAD_DBS = {}
+
+def enable_head_db(path=HEAD_DB_NAME):
+    global _HEAD_DB_PATH
+    _HEAD_DB_PATH = path
+
+def _head_db():
+    if _HEAD_DB_PATH is None:
+        return None
+    db = _HEAD_DBS.get(os.getpid())
+    if db is None:
+        db = sqlite3.connect(_HEAD_DB_PATH, timeout=30, check_same_thread=False)
+        db.execute('CREATE TABLE IF NOT EXISTS heads (url TEXT PRIMARY KEY, status INTEGER, checked REAL)')
+        _HEAD_DBS[os.getpid()] = db
+    return db
+
+def _load_head_statuses(db, urls):
+    """Return {url: status} for urls checked less than HEAD_DB_TTL seconds ago."""
+    urls = list(urls)
+    cutoff = time.time() - HEAD_DB_TTL
+    found = {}
+    # Stay under SQLite's bound-parameter limit
+    for i in range(0, len(urls), 500):
+        chunk = urls[i:i + 500]
+        query = f"SELECT url, status FROM heads WHERE checked > ? AND url IN ({','.join('?' * len(chunk))})"
+        found.update(db.execute(query, [cutoff] + chunk))
+    return found
+
+def check_urls(urls, headers=None):
+    """HEAD all unique URLs concurrently and return {url: (status, error)}."""
+    urls = set(urls)
+    now = time.monotonic()
+    results = {}
+    for url in urls:
+        hit = _HEAD_CACHE.get(url)
+        if hit and hit[0] > now:
+            results[url] = hit[1]
+    missing = urls - results.keys()
+    db = _head_db() if missing else None
+    if db is not None:
+        with _HEAD_CACHE_LOCK:
+            stored = _load_head_statuses(db, missing)
+        for url, status in stored.items():
+            results[url] = (status, None)
+        missing -= stored.keys()
+    # Claim the URLs nobody else is probing; the rest are awaited below
+    claimed, pending = {}, {}
+    with _HEAD_CACHE_LOCK:
+        for url in missing:
+            hit = _HEAD_CACHE.get(url)
+            if hit and hit[0] > now:
+                results[url] = hit[1]
+            elif url in _HEAD_IN_FLIGHT:
+                pending[url] = _HEAD_IN_FLIGHT[url]
+            else:
+                claimed[url] = _HEAD_IN_FLIGHT[url] = Future()
+    if claimed:
+        try:
+            fetched = asyncio.run(_gather(claimed, headers=headers))
+        except BaseException as e:
+            with _HEAD_CACHE_LOCK:
+                for url, future in claimed.items():
+                    del _HEAD_IN_FLIGHT[url]
+                    future.set_exception(e)
+            raise
+        # Several pages may be analyzed on worker threads at once
+        with _HEAD_CACHE_LOCK:
+            for url, status, error in fetched:
+                results[url] = (status, error)
+                if not is_session_scoped(url):
+                    _HEAD_CACHE[url] = (now + HEAD_CACHE_TTL, (status, error))
+                    _HEAD_CACHE.move_to_end(url)
+            while len(_HEAD_CACHE) > _HEAD_CACHE_SIZE:
+                _HEAD_CACHE.popitem(last=False)
+            for url, future in claimed.items():
+                del _HEAD_IN_FLIGHT[url]
+                future.set_result(results[url])
+            if db is not None:
+                # Only real answers are persisted; timeouts and connection errors are retried next run
+                checked = time.time()
+                with db:
+                    db.executemany('INSERT OR REPLACE INTO heads VALUES (?, ?, ?)',
+                                   [(url, status, checked) for url, status, error in fetched
+                                    if error is None and not is_session_scoped(url)])
+    for url, future in pending.items():
+        results[url] = future.result()
+    return results
+
+# --- Helper to parse HTML (lxml's C parser, html.parser if lxml is missing) ---
+def make_soup(content):
+    try:
+        return BeautifulSoup(content, 'lxml')
+    except FeatureNotFound:
+        return BeautifulSoup(content, 'html.parser')
+
 # --- Helper for minified detection ---
 def is_minified(text):
-    lines = text.splitlines()
-    if not lines:
+    # Newline count + length are both C-level scans; no per-line list is built
+    if not text:
         return False
-    avg_len = sum(len(l) for l in lines) / len(lines)
-    return avg_len > 200 or len(lines) < 5
+    nl = text.count('\n')
+    if nl < 4:
+        return True
+    return (len(text) - nl) / (nl + 1) > 200
 
 # --- Helper for image size detection ---
-def is_large_image(path, content):
+@lru_cache(maxsize=1024)
+def is_large_image(path):
     # Only check for base64 or local files
+    # Cached by path: shared logos/icons repeat on every page
     try:
         if path.startswith('data:image'):
             header, b64data = path.split(',', 1)
-            data = base64.b64decode(b64data)
-            return len(data) > 200*1024
-        elif os.path.exists(path):
-            return os.path.getsize(path) > 200*1024
-    except Exception:
+            # Decoded size from the base64 length; avoids allocating the decoded bytes
+            padding = 2 if b64data.endswith('==') else 1 if b64data.endswith('=') else 0
+            return (len(b64data) * 3) // 4 - padding > 200*1024
+        if path.startswith(('http://', 'https://', '//')):
+            # Remote images have no local size to check
+            return False
+        return os.stat(path).st_size > 200*1024
+    except (OSError, ValueError):
         return False
-    return False
+
+# Default severity per issue type, for make_issue and the text report formats
+SEVERITY_MAP = {
+    'SEO_MISSING_TITLE': 'error',
+    'SEO_MISSING_DESCRIPTION': 'warning',
+    'SEO_MISSING_CANONICAL': 'warning',
+    'SEO_MISSING_OG': 'warning',
+    'SEO_MISSING_TWITTER': 'info',
+    'SEO_MISSING_ROBOTS': 'info',
+    'SEO_MISSING_SITEMAP': 'info',
+    'SEO_MISSING_STRUCTURED': 'info',
+    'SEO_MISSING_MICRODATA': 'info',
+    'HTML_LARGE_IMAGE': 'warning',
+    'HTML_IMG_NO_LAZY': 'info',
+    'HTML_UNMINIFIED_INLINE_SCRIPT': 'info',
+    'HTML_UNMINIFIED_INLINE_STYLE': 'info',
+    'HTML_DEPRECATED_TAG': 'warning',
+    'HTML_MISSING_ALT': 'info',
+    'HTML_MISSING_ARIA': 'info',
+    'HTML_INPUT_NO_LABEL': 'info',
+    'HTML_HEADING_ORDER': 'info',
+    'SEO_MISSING_H1': 'warning',
+    'SEO_MULTIPLE_H1': 'warning',
+    'HTML_BROKEN_LINK': 'error',
+    'HTML_BROKEN_IMG': 'error',
+    'CSS_SPECIFICITY_WAR': 'warning',
+    'CSS_DEEP_SELECTOR': 'info',
+    'CSS_ID_SELECTOR': 'info',
+    'CSS_NONSTANDARD_PROPERTY': 'info',
+    'CSS_IMPORTANT_OVERUSE': 'info',
+    'CSS_COMPLEX_SELECTOR': 'warning',
+    'CSS_DUPLICATE_SELECTOR': 'info',
+    'CSS_LARGE_FILE': 'warning',
+    'CSS_EXCESSIVE_IMPORT': 'info',
+    'CSS_UNMINIFIED': 'info',
+    'CSS_PARSING_ERROR': 'error',
+    'JS_SYNTAX_ERROR': 'error',
+    'JS_DEPRECATED_API': 'warning',
+    'JS_LARGE_BUNDLE': 'warning',
+    'JS_SYNC_XHR': 'warning',
+    'JS_BLOCKING_SCRIPT': 'warning',
+    'JS_MODERN_SYNTAX': 'info',
+    'JS_ESLINT': 'warning',
+    'JS_ESLINT_ERROR': 'error',
+    'REACT_MISSING_KEY': 'warning',
+    'REACT_DEPRECATED_LIFECYCLE': 'warning',
+    'REACT_DIRECT_DOM': 'warning',
+    'ANGULAR_MISSING_TRACKBY': 'info',
+    'PY_FLAKE8': 'warning',
+    'PY_FLAKE8_ERROR': 'error',
+    'FLASK_DEBUG_MODE': 'warning',
+    'FLASK_HARDCODED_SECRET': 'error',
+    'PHP_PARSE_ERROR': 'error',
+    'PHP_LINT_ERROR': 'error',
+    'PHP_EVAL': 'warning',
+    'PHP_MYSQL_DEPRECATED': 'warning',
+    'PHP_UNVALIDATED_INPUT': 'warning',
+    'PKG_OLD_DEP': 'info',
+    'PKG_DEPRECATED_DEP': 'warning',
+    'PKG_PARSE_ERROR': 'error',
+    'ENV_POTENTIAL_SECRET': 'warning',
+    'ENV_PARSE_ERROR': 'error',
+    'ANGULAR_NO_OPTIMIZATION': 'info',
+    'ANGULAR_JSON_ERROR': 'error',
+    'TEXT_TODO_FIXME': 'info',
+    'TEXT_POTENTIAL_SECRET': 'warning',
+    'TEXT_DEBUG_FLAG': 'info',
+    'NETWORK_ERROR': 'info',
+    'ROBOTS_DISALLOW': 'info',
+    'SEC_INSECURE_REQUEST': 'warning',
+    'SEC_INLINE_SCRIPT': 'warning',
+    'SEC_INLINE_STYLE': 'warning',
+    'PERF_LARGE_FILE': 'warning',
+    'CSS_UNUSED_SELECTOR': 'info',
+    'JS_DANGEROUS_FUNCTION': 'warning',
+}
 
 # --- Helper to create a standardized issue dict ---
 def make_issue(issue_type, location, message, severity=None, line=None, context=None, column=None):
     if line is None or line == '' or line == '-':
         line = 'N/A'
     if not severity:
-        severity_map = {
-            'SEO_MISSING_TITLE': 'error',
-            'SEO_MISSING_DESCRIPTION': 'warning',
-            'SEO_MISSING_CANONICAL': 'warning',
-            'SEO_MISSING_OG': 'warning',
-            'SEO_MISSING_TWITTER': 'info',
-            'SEO_MISSING_ROBOTS': 'info',
-            'SEO_MISSING_SITEMAP': 'info',
-            'SEO_MISSING_STRUCTURED': 'info',
-            'SEO_MISSING_MICRODATA': 'info',
-            'HTML_LARGE_IMAGE': 'warning',
-            'HTML_IMG_NO_LAZY': 'info',
-            'HTML_UNMINIFIED_INLINE_SCRIPT': 'info',
-            'HTML_UNMINIFIED_INLINE_STYLE': 'info',
-            'HTML_DEPRECATED_TAG': 'warning',
-            'HTML_MISSING_ALT': 'info',
-            'HTML_MISSING_ARIA': 'info',
-            'HTML_INPUT_NO_LABEL': 'info',
-            'HTML_HEADING_ORDER': 'info',
-            'SEO_MISSING_H1': 'warning',
-            'SEO_MULTIPLE_H1': 'warning',
-            'HTML_BROKEN_LINK': 'error',
-            'HTML_BROKEN_IMG': 'error',
-            'CSS_SPECIFICITY_WAR': 'warning',
-            'CSS_DEEP_SELECTOR': 'info',
-            'CSS_ID_SELECTOR': 'info',
-            'CSS_NONSTANDARD_PROPERTY': 'info',
-            'CSS_IMPORTANT_OVERUSE': 'info',
-            'CSS_COMPLEX_SELECTOR': 'warning',
-            'CSS_DUPLICATE_SELECTOR': 'info',
-            'CSS_LARGE_FILE': 'warning',
-            'CSS_EXCESSIVE_IMPORT': 'info',
-            'CSS_UNMINIFIED': 'info',
-            'CSS_PARSING_ERROR': 'error',
-            'JS_SYNTAX_ERROR': 'error',
-            'JS_DEPRECATED_API': 'warning',
-            'JS_LARGE_BUNDLE': 'warning',
-            'JS_SYNC_XHR': 'warning',
-            'JS_BLOCKING_SCRIPT': 'warning',
-            'JS_MODERN_SYNTAX': 'info',
-            'JS_ESLINT': 'warning',
-            'JS_ESLINT_ERROR': 'error',
-            'REACT_MISSING_KEY': 'warning',
-            'REACT_DEPRECATED_LIFECYCLE': 'warning',
-            'REACT_DIRECT_DOM': 'warning',
-            'ANGULAR_MISSING_TRACKBY': 'info',
-            'PY_FLAKE8': 'warning',
-            'PY_FLAKE8_ERROR': 'error',
-            'FLASK_DEBUG_MODE': 'warning',
-            'FLASK_HARDCODED_SECRET': 'error',
-            'PHP_PARSE_ERROR': 'error',
-            'PHP_LINT_ERROR': 'error',
-            'PHP_EVAL': 'warning',
-            'PHP_MYSQL_DEPRECATED': 'warning',
-            'PHP_UNVALIDATED_INPUT': 'warning',
-            'PKG_OLD_DEP': 'info',
-            'PKG_DEPRECATED_DEP': 'warning',
-            'PKG_PARSE_ERROR': 'error',
-            'ENV_POTENTIAL_SECRET': 'warning',
-            'ENV_PARSE_ERROR': 'error',
-            'ANGULAR_NO_OPTIMIZATION': 'info',
-            'ANGULAR_JSON_ERROR': 'error',
-            'TEXT_TODO_FIXME': 'info',
-            'TEXT_POTENTIAL_SECRET': 'warning',
-            'TEXT_DEBUG_FLAG': 'info',
-            'NETWORK_ERROR': 'info',
-            'ROBOTS_DISALLOW': 'info',
-            'SEC_INSECURE_REQUEST': 'warning',
-            'SEC_INLINE_SCRIPT': 'warning',
-            'SEC_INLINE_STYLE': 'warning',
-            'PERF_LARGE_FILE': 'warning',
-            'CSS_UNUSED_SELECTOR': 'info',
-            'JS_DANGEROUS_FUNCTION': 'warning',
-        }
-        severity = severity_map.get(issue_type, 'Info')
+        severity = SEVERITY_MAP.get(issue_type, 'Info')
     return {
         'type': issue_type,
         'location': location,
@@ -150,6 +581,13 @@ def make_issue(issue_type, location, message, severity=None, line=None, context=
         'column': column
     }
 
+def intern_issues(issues):
+    """Share the type/severity strings again; unpickling worker results gives each file its own copies."""
+    for issue in issues:
+        issue['type'] = sys.intern(issue['type'])
+        issue['severity'] = sys.intern(issue['severity'])
+    return issues
+
 # --- Helper to find line number in HTML ---
 def find_line_number_in_html(raw_html, tag_str):
     idx = raw_html.find(tag_str)
@@ -159,204 +597,490 @@ def find_line_number_in_html(raw_html, tag_str):
 
 # --- Helper to find line number in JS/JSX/TSX ---
 def find_line_number_in_js(js_content, pattern):
+    search = re.compile(pattern).search
     for i, line in enumerate(js_content.splitlines(), 1):
-        if re.search(pattern, line):
+        if search(line):
             return i
     return '-'
 
 # --- Helper to find line number in any text file ---
+# Same boundaries as str.splitlines, so line numbers match what editors show
+_RE_LINE_BREAK = re.compile('\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+# End offsets of every line break, per document; one page or file is looked up dozens of times
+_LINE_INDEX = OrderedDict()
+_LINE_INDEX_SIZE = 32
+_LINE_INDEX_LOCK = threading.Lock()
+
+def line_break_offsets(content):
+    with _LINE_INDEX_LOCK:
+        offsets = _LINE_INDEX.get(content)
+        if offsets is not None:
+            _LINE_INDEX.move_to_end(content)
+            return offsets
+    offsets = [m.end() for m in _RE_LINE_BREAK.finditer(content)]
+    with _LINE_INDEX_LOCK:
+        _LINE_INDEX[content] = offsets
+        if len(_LINE_INDEX) > _LINE_INDEX_SIZE:
+            _LINE_INDEX.popitem(last=False)
+    return offsets
+
 def find_line_number_in_text(content, pattern_or_snippet):
     """Return the first line number (1-based) where pattern_or_snippet appears, or '-' if not found."""
-    for i, line in enumerate(content.splitlines(), 1):
-        if pattern_or_snippet in line or (hasattr(pattern_or_snippet, 'search') and pattern_or_snippet.search(line)):
-            return i
-    return '-'
+    # One search over the whole text, then a bisect into the line index; patterns must not span lines
+    search = getattr(pattern_or_snippet, 'search', None)
+    if search:
+        m = search(content)
+        index = m.start() if m else -1
+    else:
+        index = content.find(pattern_or_snippet)
+    if index < 0 or not content:
+        return '-'
+    return line_at(content, index)
+
+def line_at(content, index):
+    """1-based line number of the character at index."""
+    return bisect.bisect_right(line_break_offsets(content), index) + 1
+
+@lru_cache(maxsize=1024)
+def _start_tag_pattern(snippet):
+    # A bare '<a' must not match '<abbr'; a quoted attribute already ends the match
+    return re.compile(re.escape(snippet) + ('' if snippet.endswith('"') else r'(?=[\s/>])'))
+
+def _start_tag_snippet(el):
+    snippet = f'<{el.name}'
+    for attr, value in el.attrs.items():
+        if isinstance(value, str):
+            snippet += f' {attr}="{value}"'
+        break
+    return snippet
+
+def element_locator(el, content, search_from=None):
+    """Return (line, short start-tag snippet) for el without serializing its subtree.
+
+    Parsers without source positions (lxml) fall back to searching content. Pass one
+    search_from dict for elements visited in document order (see skip_element), so repeated
+    identical tags resolve to successive occurrences rather than all to the first.
+    """
+    snippet = _start_tag_snippet(el)
+    if el.sourceline is not None:
+        return el.sourceline, snippet + '>'
+    pos, skipped = search_from.get(snippet, (0, 0)) if search_from is not None else (0, 0)
+    pattern = _start_tag_pattern(snippet)
+    for _ in range(skipped + 1):
+        m = pattern.search(content, pos)
+        if m is None:
+            return '-', snippet + '>'
+        pos = m.end()
+    if search_from is not None:
+        search_from[snippet] = (pos, 0)
+    return line_at(content, m.start()), snippet + '>'
+
+def skip_element(el, search_from):
+    """Record that el was passed over, so element_locator's next search for the same tag skips it."""
+    if el.sourceline is None:
+        snippet = _start_tag_snippet(el)
+        pos, skipped = search_from.get(snippet, (0, 0))
+        search_from[snippet] = (pos, skipped + 1)
+
+# Prebuilt "Broken link: 404" style messages; only errors and repeated URLs need formatting
+_BROKEN_MESSAGES = {
+    label: {status: f"{label}: {status}" for status in range(400, 600)}
+    for label in ('Broken link', 'Broken image')
+}
+
+def broken_message(label, status, error, found):
+    if error or len(found) > 1:
+        return f"{label}: {error or status}{occurrences(found)}"
+    return _BROKEN_MESSAGES[label].get(status) or f"{label}: {status}"
+
+def occurrences(found):
+    return f" ({len(found)} occurrences)" if len(found) > 1 else ''
+
+def get_line_for_network_error(html, url):
+    """Line of the page that references url (absolute or as its path), or '-'."""
+    if not html:
+        return '-'
+    line = find_line_number_in_text(html, url)
+    if line == '-':
+        path = urlparse(url).path
+        if path and path != '/':
+            line = find_line_number_in_text(html, path.lstrip('/'))
+    return line
 
 # --- Advanced SEO and HTML Performance ---
+_DEPRECATED_TAGS = ('center', 'font', 'marquee')
+
+def _new_page_summary():
+    return {
+        'flags': {'canonical': False, 'og': False, 'twitter': False, 'robots': False, 'sitemap': False,
+                  'structured': False, 'microdata': False, 'title': False, 'description': False},
+        'h1_count': 0,
+        # (src, loading, node), (text, node), (text, node), (tag, node), (href, node)
+        'imgs': [], 'scripts': [], 'styles': [], 'deprecated': [], 'links': [],
+    }
+
+def _summarize_element(page, name, attrs, text, node):
+    flags = page['flags']
+    if 'itemscope' in attrs:
+        flags['microdata'] = True
+    if name == 'link':
+        rel = attrs.get('rel') or ()
+        if isinstance(rel, str):
+            rel = rel.split()
+        if 'canonical' in rel:
+            flags['canonical'] = True
+        if 'sitemap' in rel:
+            flags['sitemap'] = True
+    elif name == 'meta':
+        if attrs.get('property') == 'og:title':
+            flags['og'] = True
+        meta_name = attrs.get('name')
+        if meta_name == 'twitter:card':
+            flags['twitter'] = True
+        elif meta_name == 'robots':
+            flags['robots'] = True
+        elif meta_name == 'description':
+            flags['description'] = True
+    elif name == 'script':
+        if attrs.get('type') == 'application/ld+json':
+            flags['structured'] = True
+        if 'src' not in attrs:
+            page['scripts'].append((text(), node))
+    elif name == 'img':
+        page['imgs'].append((attrs.get('src'), attrs.get('loading'), node))
+    elif name == 'style':
+        page['styles'].append((text(), node))
+    elif name == 'a':
+        if attrs.get('href') is not None:
+            page['links'].append((attrs['href'], node))
+    elif name == 'title':
+        flags['title'] = True
+    elif name == 'h1':
+        page['h1_count'] += 1
+    elif name in _DEPRECATED_TAGS:
+        page['deprecated'].append((name, node))
+
+def summarize_page(content):
+    """Single walk over the document, collecting everything analyze_html_content checks."""
+    page = _new_page_summary()
+    if LexborHTMLParser:
+        # Lexbor walks the tree in C; much cheaper than bs4's Python object graph
+        for node in LexborHTMLParser(content).root.traverse():
+            _summarize_element(page, node.tag, node.attributes, node.text, node)
+    else:
+        for el in make_soup(content).descendants:
+            name = getattr(el, 'name', None)
+            if name is not None:
+                _summarize_element(page, name, el.attrs, lambda el=el: el.string, el)
+    return page
+
+def node_html(node):
+    """Outer HTML of a bs4 Tag or a selectolax node, for line lookups."""
+    return node.html if LexborHTMLParser and not isinstance(node, Tag) else str(node)
+
 def analyze_html_content(content, location, options, raw_html=None):
     issues = []
-    soup = BeautifulSoup(content, 'html.parser')
     raw_html = raw_html or content
     # For line number, use the raw HTML
+    page = summarize_page(content)
+    flags = page['flags']
+    h1_count = page['h1_count']
     # SEO: canonical
-    if not soup.find('link', rel='canonical'):
+    if not flags['canonical']:
         issues.append(make_issue('SEO_MISSING_CANONICAL', location, 'Missing canonical tag', line=find_line_number_in_text(raw_html, '<link rel="canonical"')))
     # SEO: Open Graph/Twitter
-    if not soup.find('meta', property='og:title'):
+    if not flags['og']:
         issues.append(make_issue('SEO_MISSING_OG', location, 'Missing Open Graph meta', line=find_line_number_in_text(raw_html, '<meta property="og:title"')))
-    if not soup.find('meta', attrs={'name': 'twitter:card'}):
+    if not flags['twitter']:
         issues.append(make_issue('SEO_MISSING_TWITTER', location, 'Missing Twitter meta', line=find_line_number_in_text(raw_html, '<meta name="twitter:card"')))
     # SEO: robots meta
-    if not soup.find('meta', attrs={'name': 'robots'}):
+    if not flags['robots']:
         issues.append(make_issue('SEO_MISSING_ROBOTS', location, 'Missing robots meta', line=find_line_number_in_text(raw_html, '<meta name="robots"')))
     # SEO: sitemap
-    if not soup.find('link', rel='sitemap'):
+    if not flags['sitemap']:
         issues.append(make_issue('SEO_MISSING_SITEMAP', location, 'Missing sitemap link', line=find_line_number_in_text(raw_html, '<link rel="sitemap"')))
     # SEO: structured data
-    if not soup.find('script', type='application/ld+json'):
+    if not flags['structured']:
         issues.append(make_issue('SEO_MISSING_STRUCTURED', location, 'Missing JSON-LD structured data', line=find_line_number_in_text(raw_html, '<script type="application/ld+json"')))
     # SEO: microdata
-    if not soup.find(attrs={'itemscope': True}):
+    if not flags['microdata']:
         issues.append(make_issue('SEO_MISSING_MICRODATA', location, 'Missing microdata', line=find_line_number_in_text(raw_html, '<itemscope')))
     # Performance: large images, missing loading=lazy
-    for img in soup.find_all('img'):
-        src = img.get('src')
+    for src, loading, img in page['imgs']:
         if src and (src.startswith('http') or src.startswith('data:image')):
-            if is_large_image(src, content):
-                issues.append(make_issue('HTML_LARGE_IMAGE', location, f'Large image: {src}', line=find_line_number_in_text(raw_html, str(img))))
-        if not img.get('loading') == 'lazy':
-            issues.append(make_issue('HTML_IMG_NO_LAZY', location, f'Image missing loading=lazy: {src}', line=find_line_number_in_text(raw_html, str(img))))
+            if is_large_image(src):
+                issues.append(make_issue('HTML_LARGE_IMAGE', location, f'Large image: {src}', line=find_line_number_in_text(raw_html, node_html(img))))
+        if not loading == 'lazy':
+            issues.append(make_issue('HTML_IMG_NO_LAZY', location, f'Image missing loading=lazy: {src}', line=find_line_number_in_text(raw_html, node_html(img))))
     # Performance: unminified inline scripts/styles
-    for script in soup.find_all('script', src=False):
-        if script.string and not is_minified(script.string):
-            issues.append(make_issue('HTML_UNMINIFIED_INLINE_SCRIPT', location, 'Unminified inline script', line=find_line_number_in_text(raw_html, str(script))))
-    for style in soup.find_all('style'):
-        if style.string and not is_minified(style.string):
-            issues.append(make_issue('HTML_UNMINIFIED_INLINE_STYLE', location, 'Unminified inline style', line=find_line_number_in_text(raw_html, str(style))))
+    for text, script in page['scripts']:
+        if text and not is_minified(text):
+            issues.append(make_issue('HTML_UNMINIFIED_INLINE_SCRIPT', location, 'Unminified inline script', line=find_line_number_in_text(raw_html, node_html(script))))
+    for text, style in page['styles']:
+        if text and not is_minified(text):
+            issues.append(make_issue('HTML_UNMINIFIED_INLINE_STYLE', location, 'Unminified inline style', line=find_line_number_in_text(raw_html, node_html(style))))
     # Deprecated tags
-    deprecated_tags = ['center', 'font', 'marquee']
-    for tag in deprecated_tags:
-        for found in soup.find_all(tag):
-            issues.append(make_issue('HTML_DEPRECATED_TAG', location, f"Deprecated HTML tag <{tag}> used", line=find_line_number_in_text(raw_html, str(found))))
+    for name, found in page['deprecated']:
+        issues.append(make_issue('HTML_DEPRECATED_TAG', location, f"Deprecated HTML tag <{name}> used", line=find_line_number_in_text(raw_html, node_html(found))))
     # Accessibility: missing aria (skip)
     # Accessibility: label/input (skip)
     # Accessibility: heading order (skip)
     # SEO: title, meta description, h1 count
-    if not soup.find('title'):
+    if not flags['title']:
         issues.append(make_issue('SEO_MISSING_TITLE', location, "Missing <title> tag", line=find_line_number_in_text(raw_html, '<title>')))
-    if not soup.find('meta', attrs={'name': 'description'}):
+    if not flags['description']:
         issues.append(make_issue('SEO_MISSING_DESCRIPTION', location, "Missing meta description", line=find_line_number_in_text(raw_html, '<meta name="description"')))
-    h1s = soup.find_all('h1')
-    if len(h1s) == 0:
+    if h1_count == 0:
         issues.append(make_issue('SEO_MISSING_H1', location, "No <h1> tag found", line=find_line_number_in_text(raw_html, '<h1>')))
-    elif len(h1s) > 1:
+    elif h1_count > 1:
         issues.append(make_issue('SEO_MULTIPLE_H1', location, "Multiple <h1> tags found", line=find_line_number_in_text(raw_html, '<h1>')))
-    # Broken links
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        if not is_absolute(href):
-            continue  # skip local links in repo mode
-        try:
-            r = requests.head(href, allow_redirects=True, timeout=5)
-            if r.status_code >= 400:
-                issues.append(make_issue('HTML_BROKEN_LINK', href, f"Broken link: {r.status_code}", line=find_line_number_in_text(raw_html, str(a))))
-        except Exception as e:
-            issues.append(make_issue('HTML_BROKEN_LINK', href, f"Broken link: {str(e)}", line=find_line_number_in_text(raw_html, str(a))))
-    for img in soup.find_all('img', src=True):
-        src = img['src']
-        if not is_absolute(src):
-            continue
-        try:
-            r = requests.head(src, allow_redirects=True, timeout=5)
-            if r.status_code >= 400:
-                issues.append(make_issue('HTML_BROKEN_IMG', src, f"Broken image: {r.status_code}", line=find_line_number_in_text(raw_html, str(img))))
-        except Exception as e:
-            issues.append(make_issue('HTML_BROKEN_IMG', src, f"Broken image: {str(e)}", line=find_line_number_in_text(raw_html, str(img))))
+    # Broken links/images: HEAD every absolute URL concurrently (local links are skipped in repo mode)
+    # Nav/footer links repeat, so group occurrences by URL and report each broken URL once
+    skip_hosts = getattr(options, 'skip_hosts', None) or ()
+    link_elems, img_elems = {}, {}
+    for href, a in page['links']:
+        if is_absolute(href) and not is_skipped_host(href, skip_hosts):
+            link_elems.setdefault(href, []).append(a)
+    for src, _, img in page['imgs']:
+        if src and is_absolute(src) and not is_skipped_host(src, skip_hosts):
+            img_elems.setdefault(src, []).append(img)
+    results = check_urls(link_elems.keys() | img_elems.keys(), headers=_SESSION.headers)
+    for kind, label, elems in (('HTML_BROKEN_LINK', 'Broken link', link_elems), ('HTML_BROKEN_IMG', 'Broken image', img_elems)):
+        for url, found in elems.items():
+            status, error = results[url]
+            if error or status >= 400:
+                issues.append(make_issue(kind, url, broken_message(label, status, error, found), line=find_line_number_in_text(raw_html, node_html(found[0]))))
     return issues
 
 # --- Advanced CSS Analysis ---
+_ELEM_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+@lru_cache(maxsize=4096)
 def css_specificity(selector):
     # Simple specificity calculation: (IDs, classes, elements)
+    # Cached: resets and utility classes repeat the same selectors across files
     id_count = selector.count('#')
     class_count = selector.count('.') + selector.count('[')
-    element_count = len(re.findall(r'\b[a-zA-Z]+\b', selector))
+    element_count = len(_ELEM_RE.findall(selector))
     return (id_count, class_count, element_count)
 
-def analyze_css_content(content, location, options, raw_content=None):
+def iter_style_rules(content):
+    """Yield (selector, declarations, rule) for each style rule; declarations are (name, value, important)."""
+    if tinycss2:
+        # tinycss2 only tokenizes: no validated CSSOM, no logging, far less allocation than cssutils
+        for rule in tinycss2.parse_stylesheet(content, skip_whitespace=True, skip_comments=True):
+            if rule.type != 'qualified-rule':
+                continue
+            selector = ' '.join(tinycss2.serialize(rule.prelude).split())
+            declarations = [(d.lower_name, tinycss2.serialize(d.value).strip(), d.important)
+                            for d in tinycss2.parse_declaration_list(rule.content, skip_whitespace=True, skip_comments=True)
+                            if d.type == 'declaration']
+            yield selector, declarations, rule
+    else:
+        for rule in cssutils.parseString(content):
+            if rule.type == CSSRule.STYLE_RULE:
+                yield rule.selectorText, [(p.name, p.value, p.priority == 'important') for p in rule.style], rule
+
+@lru_cache(maxsize=4096)
+def _rule_start_pattern(selector):
+    # cssutils re-serializes selectors ('a>b' becomes 'a > b'), so spacing around combinators is optional
+    pattern = ''
+    for part in re.split(r'(\s*[>+~,]\s*|\s+)', selector.strip()):
+        if part.isspace():
+            pattern += r'\s+'
+        elif part.strip() in ('>', '+', '~', ','):
+            pattern += r'\s*' + re.escape(part.strip()) + r'\s*'
+        elif part:
+            pattern += re.escape(part)
+    return re.compile(pattern + r'\s*\{')
+
+def style_rule_line(rule, content, search_from=None):
+    """Line of a rule from iter_style_rules, or '-' if it cannot be found.
+
+    tinycss2 tracks source positions. cssutils rules are searched for by selector; pass one
+    search_from dict for every rule of a sheet, in order, so each search starts after the
+    previous rule and a repeated selector is not reported at its first occurrence.
+    """
+    line = getattr(rule, 'source_line', None)
+    if line is not None:
+        return line
+    start = search_from.get('offset', 0) if search_from is not None else 0
+    m = _rule_start_pattern(rule.selectorText).search(content, start)
+    if m is None:
+        return '-'
+    if search_from is not None:
+        search_from['offset'] = m.end()
+    return line_at(content, m.start())
+
+def style_rule_text(rule):
+    """Source-like text of a rule from iter_style_rules, for issue context."""
+    return rule.cssText if isinstance(rule, cssutils.css.CSSStyleRule) else rule.serialize()
+
+# Identical stylesheets (vendored bootstrap.css etc.) are analyzed once per process
+_CSS_CACHE = OrderedDict()
+_CSS_CACHE_SIZE = 256
+
+def content_digest(content):
+    return hashlib.blake2b(content.encode('utf-8', 'replace'), digest_size=16).digest()
+
+def analyze_css_content(content, location, options, raw_content=None, used_selectors=None):
+    """Return the issues for one stylesheet; every selector it defines is added to used_selectors if given."""
     issues = []
     raw_content = raw_content or content
+    key = (content_digest(content), content_digest(raw_content) if raw_content is not content else None, options.max_selector_depth)
+    cached = _CSS_CACHE.get(key)
+    if cached is not None:
+        _CSS_CACHE.move_to_end(key)
+        cached_issues, cached_selectors = cached
+        if used_selectors is not None:
+            used_selectors.update(cached_selectors)
+        return [dict(issue, location=location) for issue in cached_issues]
+    # Only parsing can fail on bad input; the checks below run on whatever rules were read
     try:
-        sheet = cssutils.parseString(content)
-        selectors_seen = set()
-        specificity_map = {}
-        for rule in sheet:
-            if rule.type == CSSRule.STYLE_RULE:
-                selector = rule.selectorText
-                spec = css_specificity(selector)
-                specificity_map[selector] = spec
-                # Specificity wars
-                if spec[0] > 2 or spec[1] > 5:
-                    issues.append(make_issue('CSS_SPECIFICITY_WAR', location, f'Selector {selector} has high specificity {spec}', line=find_line_number_in_text(raw_content, str(rule))))
-                # Deep selectors
-                if selector.count(' ') > 4:
-                    issues.append(make_issue('CSS_DEEP_SELECTOR', location, f'Deep selector: {selector}', line=find_line_number_in_text(raw_content, str(rule))))
-                # Use of IDs
-                if '#' in selector:
-                    issues.append(make_issue('CSS_ID_SELECTOR', location, f'ID selector: {selector}', line=find_line_number_in_text(raw_content, str(rule))))
-                # Non-standard properties
-                for prop in rule.style:
-                    if prop.name.startswith('-') and not prop.name.startswith('--'):
-                        issues.append(make_issue('CSS_NONSTANDARD_PROPERTY', location, f'Non-standard property: {prop.name}', line=find_line_number_in_text(raw_content, str(rule))))
-                # !important
-                for prop in rule.style:
-                    if '!important' in prop.value:
-                        issues.append(make_issue('CSS_IMPORTANT_OVERUSE', location, "Use of !important in CSS", line=find_line_number_in_text(raw_content, str(rule))))
-                # Selector depth
-                if options.max_selector_depth is not None:
-                    depth = max(selector.count(' '), selector.count('>'))
-                    if depth > options.max_selector_depth:
-                        issues.append(make_issue('CSS_COMPLEX_SELECTOR', location, f"Overly complex selector: {selector}", line=find_line_number_in_text(raw_content, str(rule))))
-                # Duplicate selectors
-                if selector in selectors_seen:
-                    issues.append(make_issue('CSS_DUPLICATE_SELECTOR', location, f"Duplicate selector: {selector}", line=find_line_number_in_text(raw_content, str(rule))))
-                selectors_seen.add(selector)
-                # Track selectors for unused check
-                self.used_selectors.add(selector)
-        # Large file
-        if len(content) > 100*1024:
-            issues.append(make_issue('CSS_LARGE_FILE', location, f'CSS file > 100KB', line=find_line_number_in_text(raw_content, '/*')))
-        # Excessive @import
-        if content.count('@import') > 3:
-            issues.append(make_issue('CSS_EXCESSIVE_IMPORT', location, 'Excessive @import usage', line=find_line_number_in_text(raw_content, '/*')))
-        # Non-minified CSS
-        if not is_minified(content):
-            issues.append(make_issue('CSS_UNMINIFIED', location, 'Non-minified CSS', line=find_line_number_in_text(raw_content, '/*')))
-        # Specificity graph (optional: print or save as CSV/JSON)
-        # ...
+        rules = list(iter_style_rules(content))
     except Exception as e:
+        rules = []
         issues.append(make_issue('CSS_PARSING_ERROR', location, f"CSS parsing error: {str(e)}", line=find_line_number_in_text(raw_content, '/*')))
+    selectors_seen = set()
+    specificity_map = {}
+    located = {}
+    for selector, declarations, rule in rules:
+        # Every rule is located, in order, so cssutils' selector search keeps moving forward
+        line = style_rule_line(rule, raw_content, located)
+        spec = css_specificity(selector)
+        specificity_map[selector] = spec
+        spaces = selector.count(' ')
+        found = []
+        # Specificity wars
+        if spec[0] > 2 or spec[1] > 5:
+            found.append(('CSS_SPECIFICITY_WAR', f'Selector {selector} has high specificity {spec}'))
+        # Deep selectors
+        if spaces > 4:
+            found.append(('CSS_DEEP_SELECTOR', f'Deep selector: {selector}'))
+        # Use of IDs
+        if '#' in selector:
+            found.append(('CSS_ID_SELECTOR', f'ID selector: {selector}'))
+        # Non-standard properties and !important, in one walk over the declarations
+        for name, value, important in declarations:
+            if name.startswith('-') and not name.startswith('--'):
+                found.append(('CSS_NONSTANDARD_PROPERTY', f'Non-standard property: {name}'))
+            if important:
+                found.append(('CSS_IMPORTANT_OVERUSE', "Use of !important in CSS"))
+        # Selector depth
+        if options.max_selector_depth is not None:
+            depth = max(spaces, selector.count('>'))
+            if depth > options.max_selector_depth:
+                found.append(('CSS_COMPLEX_SELECTOR', f"Overly complex selector: {selector}"))
+        # Duplicate selectors
+        if selector in selectors_seen:
+            found.append(('CSS_DUPLICATE_SELECTOR', f"Duplicate selector: {selector}"))
+        if found:
+            issues.extend(make_issue(issue_type, location, message, line=line) for issue_type, message in found)
+        selectors_seen.add(selector)
+    # Track selectors for unused check
+    if used_selectors is not None:
+        used_selectors.update(selectors_seen)
+    # Large file
+    if len(content) > 100*1024:
+        issues.append(make_issue('CSS_LARGE_FILE', location, f'CSS file > 100KB', line=find_line_number_in_text(raw_content, '/*')))
+    # Excessive @import
+    if content.count('@import') > 3:
+        issues.append(make_issue('CSS_EXCESSIVE_IMPORT', location, 'Excessive @import usage', line=find_line_number_in_text(raw_content, '/*')))
+    # Non-minified CSS
+    if not is_minified(content):
+        issues.append(make_issue('CSS_UNMINIFIED', location, 'Non-minified CSS', line=find_line_number_in_text(raw_content, '/*')))
+    # Specificity graph (optional: print or save as CSV/JSON)
+    # ...
+    _CSS_CACHE[key] = (issues, selectors_seen)
+    if len(_CSS_CACHE) > _CSS_CACHE_SIZE:
+        _CSS_CACHE.popitem(last=False)
     return issues
 
 # --- Advanced JS Analysis ---
-def analyze_js_content(content, location, options, raw_content=None):
-    issues = []
-    raw_content = raw_content or content
+# Syntax check: QuickJS in-process if installed, `node --check` for large files, then esprima (ES2017) or pyjsparser (ES5)
+_JS_CTX = quickjs.Context() if quickjs else None
+_NODE = shutil.which('node')
+
+def check_js_syntax(content):
+    """Return the syntax error message for content, or None if it parses."""
+    if _JS_CTX is not None:
+        # new Function() only compiles the body; passing it as a value means nothing is executed
+        _JS_CTX.set('__src', content)
+        try:
+            _JS_CTX.eval('new Function(__src)')
+            return None
+        except quickjs.JSException as e:
+            return str(e)
+    if _NODE and subprocess:
+        # Used for every file when present, so the ES level never depends on file size.
+        # With no script argument node checks stdin, so nothing touches the disk
+        result = subprocess.run([_NODE, '--check'], input=content, capture_output=True, text=True)
+        if result.returncode == 0:
+            return None
+        # import/export only parse as a module, as with esprima below
+        if subprocess.run([_NODE, '--input-type=module', '--check'], input=content, capture_output=True, text=True).returncode == 0:
+            return None
+        errors = [l for l in result.stderr.splitlines() if 'Error' in l]
+        return errors[-1] if errors else result.stderr.strip()
+    if esprima:
+        try:
+            esprima.parseScript(content)
+            return None
+        except Exception as e:
+            error = str(e)
+        # import/export only parse as a module; module code is strict, so try it second
+        try:
+            esprima.parseModule(content)
+            return None
+        except Exception:
+            return error
     try:
         pyjsparser.parse(content)
+        return None
     except Exception as e:
-        issues.append(make_issue('JS_SYNTAX_ERROR', location, f"Syntax error: {str(e)}", line=find_line_number_in_text(raw_content, '/*')))
+        return str(e)
+
+def analyze_js_content(content, location, options, raw_content=None):
+    issues = []
+    raw_content = raw_content or content
+    # With --eslint the batched ESLint run reports parse failures (see lint_js_files)
+    error = None if getattr(options, 'eslint', False) and ESLINT_AVAILABLE else check_js_syntax(content)
+    if error:
+        issues.append(make_issue('JS_SYNTAX_ERROR', location, f"Syntax error: {error}", line=find_line_number_in_text(raw_content, '/*')))
+    hits = find_js_needles(content)
+    scan = set()
+    # Plain substring tests first, so legacy files skip the regex walk entirely
+    xhr_possible = 'open' in content and 'false' in content
+    modern_possible = any(token in content for token in _MODERN_JS_TOKENS)
+    if xhr_possible and modern_possible:
+        for m in _RE_JS_SCAN.finditer(content):
+            scan.add(m.lastgroup)
+            if len(scan) == 2:
+                break
+    elif xhr_possible:
+        if _RE_SYNC_XHR.search(content):
+            scan.add('xhr')
+    elif modern_possible:
+        if _RE_MODERN_JS.search(content):
+            scan.add('modern')
     # Deprecated APIs
-    deprecated_apis = ['escape(', 'unescape(', 'document.all', 'document.layers']
-    for api in deprecated_apis:
-        if api in content:
+    for api in JS_DEPRECATED_APIS:
+        if api in hits:
             issues.append(make_issue('JS_DEPRECATED_API', location, f"Deprecated API used: {api}", line=find_line_number_in_text(raw_content, api)))
     # Performance: large bundles
     if len(content) > 200*1024:
         issues.append(make_issue('JS_LARGE_BUNDLE', location, 'JS file > 200KB', line=find_line_number_in_text(raw_content, '/*')))
     # Synchronous XHR
-    if re.search(r'open\s*\(\s*["\"][A-Z]+["\"]\s*,\s*[^,]+,\s*false', content):
+    if 'xhr' in scan:
         issues.append(make_issue('JS_SYNC_XHR', location, 'Synchronous XHR detected', line=find_line_number_in_text(raw_content, '/*')))
     # Blocking scripts
-    if 'document.write' in content:
+    if 'document.write' in hits:
         issues.append(make_issue('JS_BLOCKING_SCRIPT', location, 'document.write used', line=find_line_number_in_text(raw_content, '/*')))
     # Unused code: (not trivial, skip for now)
     # Modern syntax: (warn if ES6+ features detected)
-    if re.search(r'=>|const |let |\bclass\b|\bimport\b|\bexport\b', content):
+    if 'modern' in scan:
         issues.append(make_issue('JS_MODERN_SYNTAX', location, 'Modern JS syntax detected', line=find_line_number_in_text(raw_content, '/*')))
-    # ESLint integration (optional)
-    if options.eslint and subprocess:
-        try:
-            with open('temp_eslint.js', 'w', encoding='utf-8') as f:
-                f.write(content)
-            result = subprocess.run(['eslint', 'temp_eslint.js', '-f', 'json'], capture_output=True, text=True)
-            if result.returncode != 0 and result.stdout:
-                eslint_issues = json.loads(result.stdout)
-                for file_issues in eslint_issues:
-                    for msg in file_issues.get('messages', []):
-                        issues.append(make_issue('JS_ESLINT', location, f"{msg.get('message')} (rule: {msg.get('ruleId')})", line=find_line_number_in_text(raw_content, msg.get('line'))))
-            os.remove('temp_eslint.js')
-        except Exception as e:
-            issues.append(make_issue('JS_ESLINT_ERROR', location, f"ESLint error: {str(e)}", line=find_line_number_in_text(raw_content, '/*')))
+    # ESLint runs once per batch of files in analyze_github_repo (see lint_js_files)
     return issues
 
 # --- Dependency & Config Analysis ---
@@ -365,11 +1089,12 @@ def analyze_package_json(path, raw_content=None):
     raw_content = raw_content or path
     try:
         with open(path, encoding='utf-8') as f:
-            pkg = json.load(f)
+            pkg = _json_loads(f.read())
         # Outdated/vulnerable/deprecated dependencies (basic: just warn if any dependency is pinned to old version)
         for dep_type in ['dependencies', 'devDependencies']:
             for dep, ver in pkg.get(dep_type, {}).items():
-                if re.match(r'^[<>=~]?\d+\.\d+\.\d+$', ver) and ver.startswith(('0.', '1.0.', '2.0.')):
+                m = _RE_PKG_VER.match(ver)
+                if m and (m['maj'] == '0' or (m['maj'], m['min']) in _OLD_PKG_MAJOR_MINOR):
                     issues.append(make_issue('PKG_OLD_DEP', path, f'{dep} version {ver} may be outdated', line=find_line_number_in_text(raw_content, '/*')))
                 if 'deprecated' in dep.lower():
                     issues.append(make_issue('PKG_DEPRECATED_DEP', path, f'{dep} is deprecated', line=find_line_number_in_text(raw_content, '/*')))
@@ -383,9 +1108,11 @@ def analyze_env_file(path, raw_content=None):
     raw_content = raw_content or path
     try:
         with open(path, encoding='utf-8') as f:
-            for line in f:
-                if re.search(r'(key|token|secret|password|api)[^=]*=', line, re.I):
-                    issues.append(make_issue('ENV_POTENTIAL_SECRET', path, f'Potential secret: {line.strip()}', line=find_line_number_in_text(raw_content, line)))
+            for lineno, line in enumerate(f, 1):
+                # A secret keyword in any '='-terminated segment (FOO=apikey=1 counts too), as the
+                # original (key|token|secret|password|api)[^=]*= search did; plain str ops per line
+                if '=' in line and any(k in segment for segment in line.lower().split('=')[:-1] for k in _ENV_SECRET_KEYS):
+                    issues.append(make_issue('ENV_POTENTIAL_SECRET', path, f'Potential secret: {line.strip()}', line=lineno))
     except Exception as e:
         issues.append(make_issue('ENV_PARSE_ERROR', path, f'.env parse error: {str(e)}', line=find_line_number_in_text(raw_content, '/*')))
     return issues
@@ -438,57 +1165,8 @@ ISSUE_SOLUTIONS = {
 }
 
 # --- Enhanced HTML Reporting ---
-def generate_report(issues, output_format='plain'):
-    if not issues:
-        print("No issues found!")
-        return
-    severity_map = {
-        'SEO_MISSING_TITLE': 'error',
-        'SEO_MISSING_DESCRIPTION': 'warning',
-        'SEO_MISSING_CANONICAL': 'warning',
-        'SEO_MISSING_OG': 'warning',
-        'SEO_MISSING_TWITTER': 'info',
-        'SEO_MISSING_ROBOTS': 'info',
-        'SEO_MISSING_SITEMAP': 'info',
-        'SEO_MISSING_STRUCTURED': 'info',
-        'SEO_MISSING_MICRODATA': 'info',
-        'HTML_LARGE_IMAGE': 'warning',
-        'HTML_IMG_NO_LAZY': 'info',
-        'HTML_UNMINIFIED_INLINE_SCRIPT': 'info',
-        'HTML_UNMINIFIED_INLINE_STYLE': 'info',
-        'CSS_SPECIFICITY_WAR': 'warning',
-        'CSS_DEEP_SELECTOR': 'info',
-        'CSS_ID_SELECTOR': 'info',
-        'CSS_NONSTANDARD_PROPERTY': 'info',
-        'CSS_IMPORTANT_OVERUSE': 'warning',
-        'CSS_COMPLEX_SELECTOR': 'warning',
-        'CSS_DUPLICATE_SELECTOR': 'info',
-        'CSS_LARGE_FILE': 'warning',
-        'CSS_EXCESSIVE_IMPORT': 'info',
-        'CSS_UNMINIFIED': 'info',
-        'JS_DEPRECATED_API': 'warning',
-        'JS_LARGE_BUNDLE': 'warning',
-        'JS_SYNC_XHR': 'warning',
-        'JS_BLOCKING_SCRIPT': 'warning',
-        'JS_MODERN_SYNTAX': 'info',
-        'PKG_OLD_DEP': 'warning',
-        'PKG_DEPRECATED_DEP': 'warning',
-        'PKG_PARSE_ERROR': 'error',
-        'ENV_POTENTIAL_SECRET': 'warning',
-        'ENV_PARSE_ERROR': 'error',
-        'PY_FLAKE8': 'info',
-        'FLASK_DEBUG_MODE': 'info',
-        'PHP_LINT_ERROR': 'error',
-        'PHP_EVAL': 'warning',
-        'PHP_MYSQL_DEPRECATED': 'warning',
-        'PHP_UNVALIDATED_INPUT': 'warning',
-        'REACT_MISSING_KEY': 'info',
-        'REACT_DEPRECATED_LIFECYCLE': 'warning',
-        # ... add more as needed ...
-    }
-    if output_format == 'html':
-        html_lines = []
-        html_lines.append("""<!DOCTYPE html>
+# Static parts of the HTML report; the issues themselves are streamed between them
+_REPORT_HEADER = """<!DOCTYPE html>
 <html lang='en'>
 <head>
 <meta charset='UTF-8'>
@@ -563,7 +1241,74 @@ details code { background: none; padding: 0; }
 <div class='table-wrap'>
 <table id='issues-table'>
 <thead><tr><th>#</th><th>Type</th><th>Location</th><th>Severity</th><th>Line</th><th>Code Context</th><th>Message</th><th>Solution</th><th>Auto-fix Suggestion</th></tr></thead>
-<tbody>""")
+<tbody>
+"""
+
+_REPORT_FOOTER = """</script>
+<script>
+// --- Chart.js Data ---
+let issues = JSON.parse(document.getElementById('issues').textContent);
+issues = issues.map(issue => {
+  if (!issue.type || issue.type === 'undefined') issue.type = 'Other';
+  if (!issue.severity || issue.severity === 'undefined') issue.severity = 'Info';
+  return issue;
+});
+const typeCounts = {};
+const severityCounts = {};
+issues.forEach(issue => {
+  typeCounts[issue.type] = (typeCounts[issue.type]||0)+1;
+  severityCounts[issue.severity] = (severityCounts[issue.severity]||0)+1;
+});
+const typeLabels = Object.keys(typeCounts).filter(l=>l!=='undefined');
+const typeData = typeLabels.map(l=>typeCounts[l]);
+const severityLabels = Object.keys(severityCounts).filter(l=>l!=='undefined');
+const severityData = severityLabels.map(l=>severityCounts[l]);
+new Chart(document.getElementById('typeChart').getContext('2d'), {
+  type: 'bar', data: {labels: typeLabels, datasets: [{label: 'Issues by Type', data: typeData, backgroundColor: '#8a2be2'}]}, options: {plugins: {legend: {display: false}}}
+});
+new Chart(document.getElementById('severityChart').getContext('2d'), {
+  type: 'pie', data: {labels: severityLabels, datasets: [{label: 'Issues by Severity', data: severityData, backgroundColor: ['#e67e22','#e74c3c','#f1c40f','#2ecc71','#3498db']}]}, options: {plugins: {legend: {position: 'bottom'}}}
+});
+// --- Filtering ---
+const typeFilter = document.getElementById('typeFilter');
+const severityFilter = document.getElementById('severityFilter');
+issues.forEach(issue => {
+  if(issue.type && issue.type !== 'undefined' && ![...typeFilter.options].some(o=>o.value===issue.type)){
+    let opt=document.createElement('option'); opt.value=issue.type; opt.text=issue.type; typeFilter.appendChild(opt);
+  }
+  if(issue.severity && issue.severity !== 'undefined' && ![...severityFilter.options].some(o=>o.value===issue.severity)){
+    let opt=document.createElement('option'); opt.value=issue.severity; opt.text=issue.severity; severityFilter.appendChild(opt);
+  }
+});
+function filterTable(){
+  let t=typeFilter.value, s=severityFilter.value;
+  document.querySelectorAll('#issues-table tbody tr').forEach(row=>{
+    let type=row.getAttribute('data-type'), sev=row.getAttribute('data-severity');
+    row.classList[(t&&type!==t)||(s&&sev!==s)?'add':'remove']('hide');
+  });
+}
+typeFilter.onchange=severityFilter.onchange=filterTable;
+// --- Copy Auto-fix ---
+document.querySelectorAll('.copy-btn').forEach(btn=>{
+  btn.onclick=function(){
+    let code=this.previousElementSibling.textContent;
+    navigator.clipboard.writeText(code);
+    this.textContent='Copied!';
+    setTimeout(()=>this.textContent='Copy Auto-fix',1200);
+  };
+});
+</script>
+</body></html>
+"""
+
+def generate_report(issues, output_format='plain'):
+    if not issues:
+        print("No issues found!")
+        return
+    # Output is written as it is produced; the report is never held in memory as a whole
+    write = sys.stdout.write
+    if output_format == 'html':
+        write(_REPORT_HEADER)
         # --- Auto-fix suggestion lambdas ---
         AUTO_FIX = {
             'HTML_MISSING_ALT': lambda issue: (
@@ -611,6 +1356,23 @@ details code { background: none; padding: 0; }
                 return f'<details><summary>Show code</summary><code>{html.escape(context)}</code></details>'
             return html.escape(context)
 
+        def location_link(location, line):
+            if not location:
+                return '-'
+            # Escaped once per row, shared by the href and the link text
+            escaped = html.escape(location)
+            if location.startswith('http://') or location.startswith('https://'):
+                return f'<a href="{escaped}" target="_blank">{escaped}</a>'
+            if line != 'N/A' and str(location).endswith(('.js', '.jsx', '.ts', '.tsx', '.html', '.css', '.py', '.php', '.json', '.md', '.txt', '.log')):
+                abs_path = os.path.abspath(location)
+                # VS Code URI scheme
+                return f'<a href="vscode://file/{abs_path}:{line}" title="Open in VS Code">{escaped}:{line}</a>'
+            return escaped
+
+        sol_get = ISSUE_SOLUTIONS.get
+        fix_get = AUTO_FIX.get
+        default_solution = lambda i: 'Refer to documentation or best practices for this issue.'
+        no_fix = lambda i: ''
         for i, issue in enumerate(issues, 1):
             if isinstance(issue, dict):
                 issue_type = issue.get('type', '')
@@ -620,17 +1382,6 @@ details code { background: none; padding: 0; }
                 code_context = issue.get('context', '')
                 col = issue.get('column', '')
                 severity = issue.get('severity', 'Info')
-                # --- Make location clickable ---
-                if location.startswith('http://') or location.startswith('https://'):
-                    location_html = f'<a href="{html.escape(location)}" target="_blank">{html.escape(location)}</a>'
-                elif location and line != 'N/A' and str(location).endswith(('.js', '.jsx', '.ts', '.tsx', '.html', '.css', '.py', '.php', '.json', '.md', '.txt', '.log')):
-                    abs_path = os.path.abspath(location)
-                    # VS Code URI scheme
-                    location_html = f'<a href="vscode://file/{abs_path}:{line}" title="Open in VS Code">{html.escape(location)}:{line}</a>'
-                elif location:
-                    location_html = html.escape(location)
-                else:
-                    location_html = '-'
             elif isinstance(issue, (list, tuple)) and len(issue) >= 3:
                 issue_type, location, message = issue[:3]
                 line = issue[3] if len(issue) > 3 else '-'
@@ -638,17 +1389,6 @@ details code { background: none; padding: 0; }
                 col = issue[5] if len(issue) > 5 else ''
                 severity = 'Info'
                 issue = {'type': issue_type, 'location': location, 'message': message, 'line': line, 'context': code_context, 'column': col, 'severity': severity}
-                # --- Make location clickable ---
-                if location.startswith('http://') or location.startswith('https://'):
-                    location_html = f'<a href="{html.escape(location)}" target="_blank">{html.escape(location)}</a>'
-                elif location and line != 'N/A' and str(location).endswith(('.js', '.jsx', '.ts', '.tsx', '.html', '.css', '.py', '.php', '.json', '.md', '.txt', '.log')):
-                    abs_path = os.path.abspath(location)
-                    # VS Code URI scheme
-                    location_html = f'<a href="vscode://file/{abs_path}:{line}" title="Open in VS Code">{html.escape(location)}:{line}</a>'
-                elif location:
-                    location_html = html.escape(location)
-                else:
-                    location_html = '-'
             else:
                 issue_type = str(issue)
                 location = ''
@@ -658,21 +1398,12 @@ details code { background: none; padding: 0; }
                 col = ''
                 severity = 'Info'
                 issue = {'type': issue_type, 'location': location, 'message': message, 'line': line, 'context': code_context, 'column': col, 'severity': severity}
-                # --- Make location clickable ---
-                if location.startswith('http://') or location.startswith('https://'):
-                    location_html = f'<a href="{html.escape(location)}" target="_blank">{html.escape(location)}</a>'
-                elif location and line != 'N/A' and str(location).endswith(('.js', '.jsx', '.ts', '.tsx', '.html', '.css', '.py', '.php', '.json', '.md', '.txt', '.log')):
-                    abs_path = os.path.abspath(location)
-                    # VS Code URI scheme
-                    location_html = f'<a href="vscode://file/{abs_path}:{line}" title="Open in VS Code">{html.escape(location)}:{line}</a>'
-                elif location:
-                    location_html = html.escape(location)
-                else:
-                    location_html = '-'
-            solution = ISSUE_SOLUTIONS.get(issue_type, lambda i: 'Refer to documentation or best practices for this issue.')(issue)
-            autofix = AUTO_FIX.get(issue_type, lambda i: '')(issue)
+            # --- Make location clickable ---
+            location_html = location_link(location, line)
+            solution = sol_get(issue_type, default_solution)(issue)
+            autofix = fix_get(issue_type, no_fix)(issue)
             code_html = highlight_code_context(code_context, col)
-            html_lines.append(
+            write(
                 f"<tr>"
                 f"<td>{i}</td>"
                 f"<td>{html.escape(str(issue_type))}</td>"
@@ -683,182 +1414,96 @@ details code { background: none; padding: 0; }
                 f"<td>{html.escape(str(message))}</td>"
                 f"<td class='solution'>{solution}</td>"
                 f"<td class='autofix'>{autofix}</td>"
-                f"</tr>"
+                f"</tr>\n"
             )
-        html_lines.append("""
-</tbody></table>
-</div>
-<script>
-// --- Chart.js Data ---
-const issues = """ + json.dumps(issues) + """;
-issues = issues.map(issue => {
-  if (!issue.type || issue.type === 'undefined') issue.type = 'Other';
-  if (!issue.severity || issue.severity === 'undefined') issue.severity = 'Info';
-  return issue;
-});
-const typeCounts = {};
-const severityCounts = {};
-issues.forEach(issue => {
-  typeCounts[issue.type] = (typeCounts[issue.type]||0)+1;
-  severityCounts[issue.severity] = (severityCounts[issue.severity]||0)+1;
-});
-const typeLabels = Object.keys(typeCounts).filter(l=>l!=='undefined');
-const typeData = typeLabels.map(l=>typeCounts[l]);
-const severityLabels = Object.keys(severityCounts).filter(l=>l!=='undefined');
-const severityData = severityLabels.map(l=>severityCounts[l]);
-new Chart(document.getElementById('typeChart').getContext('2d'), {
-  type: 'bar', data: {labels: typeLabels, datasets: [{label: 'Issues by Type', data: typeData, backgroundColor: '#8a2be2'}]}, options: {plugins: {legend: {display: false}}}
-});
-new Chart(document.getElementById('severityChart').getContext('2d'), {
-  type: 'pie', data: {labels: severityLabels, datasets: [{label: 'Issues by Severity', data: severityData, backgroundColor: ['#e67e22','#e74c3c','#f1c40f','#2ecc71','#3498db']}]}, options: {plugins: {legend: {position: 'bottom'}}}
-});
-// --- Filtering ---
-const typeFilter = document.getElementById('typeFilter');
-const severityFilter = document.getElementById('severityFilter');
-issues.forEach(issue => {
-  if(issue.type && issue.type !== 'undefined' && ![...typeFilter.options].some(o=>o.value===issue.type)){
-    let opt=document.createElement('option'); opt.value=issue.type; opt.text=issue.type; typeFilter.appendChild(opt);
-  }
-  if(issue.severity && issue.severity !== 'undefined' && ![...severityFilter.options].some(o=>o.value===issue.severity)){
-    let opt=document.createElement('option'); opt.value=issue.severity; opt.text=issue.severity; severityFilter.appendChild(opt);
-  }
-});
-function filterTable(){
-  let t=typeFilter.value, s=severityFilter.value;
-  document.querySelectorAll('#issues-table tbody tr').forEach(row=>{
-    let type=row.getAttribute('data-type'), sev=row.getAttribute('data-severity');
-    row.classList[(t&&type!==t)||(s&&sev!==s)?'add':'remove']('hide');
-  });
-}
-typeFilter.onchange=severityFilter.onchange=filterTable;
-// --- Copy Auto-fix ---
-document.querySelectorAll('.copy-btn').forEach(btn=>{
-  btn.onclick=function(){
-    let code=this.previousElementSibling.textContent;
-    navigator.clipboard.writeText(code);
-    this.textContent='Copied!';
-    setTimeout(()=>this.textContent='Copy Auto-fix',1200);
-  };
-});
-</script>
-</body></html>""")
-        print('\n'.join(html_lines))
+        write("\n</tbody></table>\n</div>\n<script id='issues' type='application/json'>")
+        # Compact JSON in a data block; '<' is escaped so no string can close the element
+        write(json.dumps(issues, separators=(',', ':'), default=str).replace('<', '\\u003c'))
+        write(_REPORT_FOOTER)
         return
-    elif output_format == 'json':
-        print(json.dumps([
-            {'type': t, 'location': l, 'message': m, 'severity': severity_map.get(t, 'info')} for t, l, m in issues
-        ], indent=2))
+    # The text formats only need type/location/message/severity; kept as parallel columns
+    codes, locations, messages = [], [], []
+    for issue in issues:
+        if isinstance(issue, dict):
+            codes.append(issue.get('type', ''))
+            locations.append(issue.get('location', ''))
+            messages.append(issue.get('message', ''))
+        else:
+            codes.append(issue[0])
+            locations.append(issue[1])
+            messages.append(issue[2])
+    sev_get = SEVERITY_MAP.get
+    severities = [sev_get(t, 'info') for t in codes]
+    columns = (codes, locations, messages, severities)
+    if output_format == 'json':
+        write(_json_dumps([
+            {'type': t, 'location': l, 'message': m, 'severity': sev} for t, l, m, sev in zip(*columns)
+        ]))
+        write('\n')
     elif output_format == 'csv':
         writer = csv.writer(sys.stdout)
         writer.writerow(['Type', 'Location', 'Message', 'Severity'])
-        for t, l, m in issues:
-            writer.writerow([t, l, m, severity_map.get(t, 'info')])
+        writer.writerows(zip(*columns))
     elif output_format == 'markdown':
-        print('| Type | Location | Message | Severity |')
-        print('|------|----------|---------|----------|')
-        for t, l, m in issues:
-            print(f'| {t} | {l} | {m} | {severity_map.get(t, "info")} |')
+        write('| Type | Location | Message | Severity |\n')
+        write('|------|----------|---------|----------|\n')
+        for t, l, m, sev in zip(*columns):
+            write(f'| {t} | {l} | {m} | {sev} |\n')
     else:
-        print(f"Found {len(issues)} issues:")
-        print("=" * 60)
-        for i, (issue_type, location, message) in enumerate(issues, 1):
-            sev = severity_map.get(issue_type, 'info')
-            print(f"{i}. [{issue_type}] ({sev})")
-            print(f"   Location: {location}")
-            print(f"   Issue: {message}")
-            print("-" * 60)
+        write(f"Found {len(issues)} issues:\n")
+        write("=" * 60 + "\n")
+        for i, (issue_type, location, message, sev) in enumerate(zip(*columns), 1):
+            write(f"{i}. [{issue_type}] ({sev})\n"
+                  f"   Location: {location}\n"
+                  f"   Issue: {message}\n"
+                  + "-" * 60 + "\n")
     # Summary statistics
-    stats = {}
-    for t, _, _ in issues:
-        stats[t] = stats.get(t, 0) + 1
-    print("\nSummary:")
+    stats = Counter(codes)
+    write("\nSummary:\n")
     for t, count in stats.items():
-        print(f"  {t}: {count}")
+        write(f"  {t}: {count}\n")
 
 # --- React/JSX/TSX/Angular/TS Analysis ---
 def analyze_jsx_tsx_content(content, location, options):
     issues = []
-    # Use ESLint with React/TS plugins if available
-    if options.eslint and subprocess:
-        try:
-            ext = os.path.splitext(location)[1].lower()
-            temp_file = f'temp_eslint{ext}'
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            result = subprocess.run(['eslint', temp_file, '-f', 'json'], capture_output=True, text=True)
-            if result.stdout:
-                eslint_issues = json.loads(result.stdout)
-                for file_issues in eslint_issues:
-                    for msg in file_issues.get('messages', []):
-                        issues.append(make_issue('REACT_ESLINT' if ext in ['.jsx', '.tsx'] else 'TS_ESLINT', location, f"{msg.get('message')} (rule: {msg.get('ruleId')})", line=find_line_number_in_text(content, msg.get('line'))))
-            os.remove(temp_file)
-        except Exception as e:
-            issues.append(make_issue('ESLINT_ERROR', location, f"ESLint error: {str(e)}", line=find_line_number_in_text(content, '/*')))
+    # ESLint (with React/TS plugins if configured) runs batched in analyze_github_repo
     # Heuristic checks for React
     if 'React.Component' in content or 'useState' in content or 'useEffect' in content:
-        if re.search(r'<\w+\s+key=[^\s>]+', content) is None and re.search(r'\.map\(', content):
-            pattern = r'\.map\('
-            line = find_line_number_in_text(content, pattern)
+        if _RE_REACT_KEY.search(content) is None and _RE_MAP.search(content):
+            line = find_line_number_in_text(content, _RE_MAP)
             issues.append(make_issue('REACT_MISSING_KEY', location, 'Missing key prop in list rendering', line=line))
-        if re.search(r'componentWillMount|componentWillReceiveProps|componentWillUpdate', content):
+        if _RE_LIFECYCLE.search(content):
             issues.append(make_issue('REACT_DEPRECATED_LIFECYCLE', location, 'Deprecated lifecycle method used', line=find_line_number_in_text(content, '/*')))
-        if re.search(r'document\.getElementById|document\.querySelector', content):
+        if _RE_DIRECT_DOM.search(content):
             issues.append(make_issue('REACT_DIRECT_DOM', location, 'Direct DOM manipulation in React', line=find_line_number_in_text(content, '/*')))
     # Heuristic checks for Angular
     if '@Component' in content or 'NgModule' in content:
-        if re.search(r'\*ngFor(?!.*trackBy)', content):
+        if _RE_NGFOR.search(content):
             issues.append(make_issue('ANGULAR_MISSING_TRACKBY', location, 'Missing trackBy in *ngFor', line=find_line_number_in_text(content, '/*')))
     return issues
 
 # --- Python/Flask Analysis ---
 def analyze_python_content(content, location, options):
     issues = []
-    # Use flake8 for linting
-    try:
-        temp_file = 'temp_flake8.py'
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        result = subprocess.run(['flake8', temp_file, '--format=%(row)d:%(col)d: %(code)s %(text)s'], capture_output=True, text=True)
-        if result.stdout:
-            for line in result.stdout.splitlines():
-                # Extract line/col if possible
-                m = re.match(r'^(\d+):(\d+): ([A-Z]\d+) (.*)$', line)
-                if m:
-                    row, col, code, text = m.groups()
-                    issues.append(make_issue('PY_FLAKE8', location, f'{code} {text}', line=row, column=col))
-                else:
-                    issues.append(make_issue('PY_FLAKE8', location, line, line=find_line_number_in_text(content, line)))
-        os.remove(temp_file)
-    except Exception as e:
-        issues.append(make_issue('PY_FLAKE8_ERROR', location, f'flake8 error: {str(e)}', line=find_line_number_in_text(content, '/*')))
+    # flake8 runs once per batch of files in analyze_github_repo (see lint_python_files)
     # Flask-specific
     if 'Flask(' in content:
         if 'debug=True' in content:
             issues.append(make_issue('FLASK_DEBUG_MODE', location, 'Flask debug mode enabled', line=find_line_number_in_text(content, '/*')))
-        if 'SECRET_KEY' in content and re.search(r'SECRET_KEY\s*=\s*["\"][^"\"]+["\"]', content):
+        if 'SECRET_KEY' in content and _RE_FLASK_SECRET.search(content):
             issues.append(make_issue('FLASK_HARDCODED_SECRET', location, 'Hardcoded Flask SECRET_KEY', line=find_line_number_in_text(content, '/*')))
     return issues
 
 # --- PHP Analysis ---
 def analyze_php_content(content, location, options):
     issues = []
-    # Use PHP lint if available
-    try:
-        temp_file = 'temp_php.php'
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        result = subprocess.run(['php', '-l', temp_file], capture_output=True, text=True)
-        if 'Parse error' in result.stdout or 'Parse error' in result.stderr:
-            issues.append(make_issue('PHP_PARSE_ERROR', location, result.stdout + result.stderr, line=find_line_number_in_text(content, '/*')))
-        os.remove(temp_file)
-    except Exception as e:
-        issues.append(make_issue('PHP_LINT_ERROR', location, f'php -l error: {str(e)}', line=find_line_number_in_text(content, '/*')))
+    # php -l runs from analyze_github_repo (see lint_php_files)
     # Heuristic checks
     if 'eval(' in content:
         issues.append(make_issue('PHP_EVAL', location, 'Use of eval()', line=find_line_number_in_text(content, '/*')))
-    if re.search(r'mysql_\w+\(', content):
+    if _RE_PHP_MYSQL.search(content):
         issues.append(make_issue('PHP_MYSQL_DEPRECATED', location, 'Use of deprecated mysql_* functions', line=find_line_number_in_text(content, '/*')))
-    if re.search(r'\$_(GET|POST|REQUEST|COOKIE)\[', content) and not re.search(r'htmlspecialchars|filter_var', content):
+    if _RE_PHP_INPUT.search(content) and not _RE_PHP_SANITIZE.search(content):
         issues.append(make_issue('PHP_UNVALIDATED_INPUT', location, 'Potential unvalidated input', line=find_line_number_in_text(content, '/*')))
     return issues
 
@@ -866,7 +1511,7 @@ def analyze_php_content(content, location, options):
 def analyze_angular_json_content(content, location, options):
     issues = []
     try:
-        data = json.loads(content)
+        data = _json_loads(content)
         if 'projects' in data:
             for proj, conf in data['projects'].items():
                 if 'architect' in conf and 'build' in conf['architect']:
@@ -879,64 +1524,338 @@ def analyze_angular_json_content(content, location, options):
 # --- Analyze generic text files for common issues ---
 def analyze_text_file(content, location, options):
     issues = []
-    patterns = [
-        (re.compile(r'TODO|FIXME', re.I), 'TODO or FIXME found', 'TEXT_TODO_FIXME'),
-        (re.compile(r'(password|secret|token|key)[^=]*=', re.I), 'Possible secret or password assignment', 'TEXT_POTENTIAL_SECRET'),
-        (re.compile(r'\bdebug\b', re.I), 'Debug flag found', 'TEXT_DEBUG_FLAG'),
-    ]
     for i, line in enumerate(content.splitlines(), 1):
-        for pattern, msg, issue_type in patterns:
+        for pattern, msg, issue_type in _TEXT_PATTERNS:
             if pattern.search(line):
                 issues.append(make_issue(issue_type, location, msg, line=i, context=line.strip()))
     return issues
 
+# --- Batched linting: one linter process per batch of repo files ---
+LINT_BATCH_SIZE = 200
+# eslint_d keeps a warm ESLint daemon, so each call skips Node/ESLint startup; same CLI as eslint
+ESLINT = shutil.which('eslint_d') or 'eslint'
+ESLINT_AVAILABLE = shutil.which(ESLINT) is not None
+
+def _lint_batches(paths):
+    for i in range(0, len(paths), LINT_BATCH_SIZE):
+        yield paths[i:i + LINT_BATCH_SIZE]
+
+def _js_syntax_issues(path):
+    """Local syntax check for a .js file ESLint gave no result for."""
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except OSError:
+        return []
+    error = check_js_syntax(content)
+    if not error:
+        return []
+    return [make_issue('JS_SYNTAX_ERROR', path, f"Syntax error: {error}", line=find_line_number_in_text(content, '/*'))]
+
+def lint_js_files(paths):
+    issues = []
+    for batch in _lint_batches(paths):
+        linted = set()
+        try:
+            # JSON output is parsed straight from bytes; text mode would decode it first
+            result = subprocess.run([ESLINT, '-f', 'json'] + batch, capture_output=True)
+            if result.stdout:
+                for file_issues in _json_loads(result.stdout):
+                    location = file_issues.get('filePath')
+                    linted.add(os.path.realpath(location))
+                    ext = os.path.splitext(location)[1].lower()
+                    issue_type = 'JS_ESLINT' if ext == '.js' else 'REACT_ESLINT' if ext in ['.jsx', '.tsx'] else 'TS_ESLINT'
+                    for msg in file_issues.get('messages', []):
+                        if msg.get('fatal') and ext == '.js':
+                            # ESLint's parser failed; this replaces the local syntax check for .js files
+                            issues.append(make_issue('JS_SYNTAX_ERROR', location, f"Syntax error: {msg.get('message')}", line=msg.get('line'), column=msg.get('column')))
+                            continue
+                        issues.append(make_issue(issue_type, location, f"{msg.get('message')} (rule: {msg.get('ruleId')})", line=msg.get('line'), column=msg.get('column')))
+            else:
+                # No report at all: missing config, crash, bad arguments
+                reason = result.stderr.decode('utf-8', 'replace').strip() or f'exit status {result.returncode}'
+                issues += [make_issue('JS_ESLINT_ERROR', path, f"ESLint error: {reason}") for path in batch]
+        except Exception as e:
+            issues += [make_issue('JS_ESLINT_ERROR', path, f"ESLint error: {str(e)}") for path in batch]
+        # analyze_js_content leaves syntax errors to ESLint, so check .js files it gave no result for here
+        for path in batch:
+            if os.path.splitext(path)[1].lower() == '.js' and os.path.realpath(path) not in linted:
+                issues += _js_syntax_issues(path)
+    return issues
+
+def lint_python_files(paths):
+    issues = []
+    for batch in _lint_batches(paths):
+        try:
+            result = subprocess.run(['flake8', '--format=%(path)s:%(row)d:%(col)d: %(code)s %(text)s'] + batch, capture_output=True, text=True)
+            for line in result.stdout.splitlines():
+                m = _RE_FLAKE8_LINE.match(line)
+                if m:
+                    path, row, col, code, text = m.groups()
+                    issues.append(make_issue('PY_FLAKE8', path, f'{code} {text}', line=row, column=col))
+        except Exception as e:
+            issues += [make_issue('PY_FLAKE8_ERROR', path, f'flake8 error: {str(e)}') for path in batch]
+    return issues
+
+def _lint_php_file(path):
+    try:
+        result = subprocess.run(['php', '-l', path], capture_output=True, text=True)
+        if 'Parse error' in result.stdout or 'Parse error' in result.stderr:
+            return [make_issue('PHP_PARSE_ERROR', path, result.stdout + result.stderr)]
+    except Exception as e:
+        return [make_issue('PHP_LINT_ERROR', path, f'php -l error: {str(e)}')]
+    return []
+
+def lint_php_files(paths):
+    # php -l only lints one file per invocation (before PHP 8.3), so overlap the processes instead
+    issues = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for result in ex.map(_lint_php_file, paths):
+            issues.extend(result)
+    return issues
+
 # --- Repo Analysis ---
+OPTION_NAMES = ('html', 'css', 'js', 'perfsec', 'ignore_robots', 'max_selector_depth', 'eslint', 'http_cache', 'skip_hosts')
+
+def options_to_dict(options):
+    # Worker processes need picklable options; the CLI builds them as a local class
+    return {name: getattr(options, name, None) for name in OPTION_NAMES}
+
+# Set once per worker process by the pool initializer, so tasks only carry a path
+_WORKER_OPTIONS = None
+
+def _init_worker(options_dict):
+    global _WORKER_OPTIONS
+    _WORKER_OPTIONS = types.SimpleNamespace(**options_dict)
+    install_dns_cache()
+    if options_dict.get('http_cache'):
+        enable_head_db()
+
+def _analyze_one(path):
+    """Analyze a single repo file; runs in a worker process."""
+    options = _WORKER_OPTIONS
+    file = os.path.basename(path)
+    ext = os.path.splitext(file)[1].lower()
+    try:
+        with open(path, encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+    except Exception:
+        return []
+    if ext in ['.html', '.jinja', '.j2'] and options.html:
+        return analyze_html_content(content, path, options, content)
+    elif ext in ['.css'] and options.css:
+        return analyze_css_content(content, path, options, content)
+    elif ext in ['.js'] and options.js:
+        return analyze_js_content(content, path, options, content)
+    elif ext in ['.jsx', '.tsx', '.ts'] and options.js:
+        return analyze_jsx_tsx_content(content, path, options)
+    elif ext == '.py':
+        return analyze_python_content(content, path, options)
+    elif ext == '.php':
+        return analyze_php_content(content, path, options)
+    elif file == 'package.json':
+        return analyze_package_json(path, content)
+    elif file == '.env':
+        return analyze_env_file(path, content)
+    elif file == 'angular.json':
+        return analyze_angular_json_content(content, path, options)
+    elif ext in ['.txt', '.md', '.log']:
+        return analyze_text_file(content, path, options)
+    return []
+
+CLONE_OPTIONS = ['--depth=1', '--single-branch', '--no-tags']
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'vendor', 'dist', 'build'}
+# Minified bundles are generated output; every line-based check on them is noise
+SKIP_SUFFIXES = ('.min.js', '.min.css')
+ANALYZED_EXTS = {'.html', '.jinja', '.j2', '.css', '.js', '.jsx', '.tsx', '.ts', '.py', '.php', '.txt', '.md', '.log'}
+ANALYZED_FILES = {'package.json', '.env', 'angular.json'}
+MAX_FILE_BYTES = 1024 * 1024
+# Files per worker round-trip; most repo files are small, so per-task IPC would dominate
+REPO_CHUNKSIZE = 16
+
 def analyze_github_repo(repo_url, options):
     temp_dir = tempfile.mkdtemp()
     try:
         print(f"Cloning {repo_url} ...")
-        git.Repo.clone_from(repo_url, temp_dir)
-        issues = []
+        # Only the working tree is analyzed, so skip history and tags; never prompt for credentials
+        git.Repo.clone_from(repo_url, temp_dir, multi_options=CLONE_OPTIONS,
+                            env={'GIT_TERMINAL_PROMPT': '0'})
+        paths = []
+        first_paths = {}
+        js_files, py_files, php_files = [], [], []
+        skip_dirs = getattr(options, 'skip_dirs', None) or SKIP_DIRS
+        max_file_bytes = getattr(options, 'max_file_bytes', None) or MAX_FILE_BYTES
         for root, dirs, files in os.walk(temp_dir):
+            # Prune in place so os.walk never descends into VCS metadata or vendored/build output
+            dirs[:] = [d for d in dirs if d not in skip_dirs]
             for file in files:
-                path = os.path.join(root, file)
                 ext = os.path.splitext(file)[1].lower()
+                if ext not in ANALYZED_EXTS and file not in ANALYZED_FILES:
+                    continue
+                if file.lower().endswith(SKIP_SUFFIXES):
+                    continue
+                path = os.path.join(root, file)
                 try:
-                    with open(path, encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                except Exception:
+                    size = os.path.getsize(path)
+                except OSError:
                     continue
-                if ext in ['.html', '.jinja', '.j2'] and options.html:
-                    issues += analyze_html_content(content, path, options, content)
-                elif ext in ['.css'] and options.css:
-                    issues += analyze_css_content(content, path, options, content)
-                elif ext in ['.js'] and options.js:
-                    issues += analyze_js_content(content, path, options, content)
-                elif ext in ['.jsx', '.tsx', '.ts'] and options.js:
-                    issues += analyze_jsx_tsx_content(content, path, options)
+                if size > max_file_bytes:
+                    print(f"Skipping {path}: {size} bytes exceeds {max_file_bytes}", file=sys.stderr)
+                    continue
+                # Identical files (vendored copies) are analyzed once; the key includes
+                # what the dispatch in _analyze_one looks at besides the content
+                try:
+                    with open(path, 'rb') as f:
+                        key = (hashlib.blake2b(f.read(), digest_size=16).digest(), ext,
+                               file if file in ANALYZED_FILES else None)
+                except OSError:
+                    continue
+                paths.append((path, first_paths.setdefault(key, path)))
+                if ext in ['.js', '.jsx', '.tsx', '.ts'] and options.js:
+                    js_files.append(path)
                 elif ext == '.py':
-                    issues += analyze_python_content(content, path, options)
+                    py_files.append(path)
                 elif ext == '.php':
-                    issues += analyze_php_content(content, path, options)
-                elif file == 'package.json':
-                    issues += analyze_package_json(path, content)
-                elif file == '.env':
-                    issues += analyze_env_file(path, content)
-                elif file == 'angular.json':
-                    issues += analyze_angular_json_content(content, path, options)
-                elif ext in ['.txt', '.md', '.log']:
-                    issues += analyze_text_file(content, path, options)
+                    php_files.append(path)
+        # Files are independent and the analyzers are CPU-bound, so spread them over all cores
+        unique_paths = list(first_paths.values())
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker,
+                                 initargs=(options_to_dict(options),)) as ex:
+            results = dict(zip(unique_paths, ex.map(_analyze_one, unique_paths, chunksize=REPO_CHUNKSIZE)))
+        issues = []
+        # Collect in walk order so the report stays deterministic
+        for path, first in paths:
+            result = results[first]
+            if path == first:
+                issues.extend(intern_issues(result))
+            else:
+                # Some issues are located at a URL rather than the file; keep those as-is
+                issues.extend(dict(i, location=path) if i['location'] == first else i for i in result)
+        # Linters are launched once per batch instead of once per file
+        if subprocess:
+            if js_files and options.eslint:
+                issues += lint_js_files(js_files)
+            issues += lint_python_files(py_files)
+            issues += lint_php_files(php_files)
         return issues
     finally:
         shutil.rmtree(temp_dir)
 
+_RE_NON_SIMPLE_SELECTOR = re.compile(r'[\[\]:>~+]')
+_RE_SELECTOR_TOKEN = re.compile(r'([#.]?)(-?[_a-zA-Z][\w-]*|\*)')
+
+def selector_matches(selector, tags, ids, classes):
+    """True if any group of a simple (combinator-free) selector has all its tag/#id/.class tokens on the page."""
+    for group in selector.split(','):
+        compounds = group.split()
+        if compounds and all(_compound_present(compound, tags, ids, classes) for compound in compounds):
+            return True
+    return False
+
+def _compound_present(compound, tags, ids, classes):
+    for prefix, name in _RE_SELECTOR_TOKEN.findall(compound):
+        if prefix == '#':
+            if name not in ids:
+                return False
+        elif prefix == '.':
+            if name not in classes:
+                return False
+        elif name != '*' and name.lower() not in tags:
+            return False
+    return True
+
+def analyze_page_css(css_content, source, max_selector_depth, collect_rules=False):
+    """Return (issues, selectors, rules) for one stylesheet or style block of a live page.
+
+    With collect_rules, rules lists (selector, line, rule text) for every simple selector, so
+    the unused-selector check can run without parsing the sheet again.
+    """
+    issues = []
+    selectors = set()
+    rules = []
+    try:
+        selectors_seen = set()
+        located = {}
+        for selector, declarations, rule in iter_style_rules(css_content):
+            line, text = style_rule_line(rule, css_content, located), style_rule_text(rule)
+            # !important and vendor prefixes, in one walk over the declarations
+            for name, value, important in declarations:
+                if important:
+                    issues.append(make_issue('CSS_IMPORTANT_OVERUSE', source, "Use of !important in CSS", line=line, context=text))
+                if name.startswith(('-webkit-', '-moz-', '-ms-')):
+                    issues.append(make_issue('CSS_VENDOR_PREFIX', source, f"Vendor prefix used: {name}", line=line, context=text))
+            # Selector depth
+            if max_selector_depth is not None:
+                depth = max(selector.count(' '), selector.count('>'))
+                if depth > max_selector_depth:
+                    issues.append(make_issue('CSS_COMPLEX_SELECTOR', source, f"Overly complex selector: {selector}", line=line, context=text))
+            # Duplicate selectors
+            if selector in selectors_seen:
+                issues.append(make_issue('CSS_DUPLICATE_SELECTOR', source, f"Duplicate selector: {selector}", line=line, context=text))
+            selectors_seen.add(selector)
+            # Track selectors for unused check
+            selectors.add(selector)
+            if collect_rules and selector and not _RE_NON_SIMPLE_SELECTOR.search(selector):
+                rules.append((selector, line, text))
+    except Exception as e:
+        issues.append(make_issue('CSS_PARSING_ERROR', source, f"CSS parsing error: {str(e)}", line=find_line_number_in_text(css_content, '/*')))
+    return issues, selectors, rules
+
+def analyze_inline_styles(styles, html_content, source):
+    """Return the issues for a page's style="..." attributes, parsed together as one synthetic stylesheet."""
+    issues = []
+    # One rule per attribute under a unique class, so each parsed rule maps back to its attribute;
+    # values with braces are not valid declaration lists and would swallow the following rules
+    by_selector = {f'.__inline_{i}__': value for i, value in enumerate(styles) if '{' not in value and '}' not in value}
+    if not by_selector:
+        return issues
+    sheet = '\n'.join(f'{selector} {{{value}}}' for selector, value in by_selector.items())
+    try:
+        for selector, declarations, rule in iter_style_rules(sheet):
+            value = by_selector.get(selector)
+            if value is None:
+                continue
+            context = f'style="{value}"'
+            for name, _, important in declarations:
+                if important:
+                    issues.append(make_issue('CSS_IMPORTANT_OVERUSE', source, "Use of !important in CSS", line=find_line_number_in_text(html_content, value), context=context))
+                if name.startswith(('-webkit-', '-moz-', '-ms-')):
+                    issues.append(make_issue('CSS_VENDOR_PREFIX', source, f"Vendor prefix used: {name}", line=find_line_number_in_text(html_content, value), context=context))
+    except Exception as e:
+        issues.append(make_issue('CSS_PARSING_ERROR', source, f"CSS parsing error: {str(e)}", line=find_line_number_in_text(html_content, '/*')))
+    return issues
+
+def analyze_page_js(js_content, source):
+    """Return the issues for one external or inline script of a live page."""
+    issues = []
+    error = check_js_syntax(js_content)
+    if error:
+        issues.append(make_issue('JS_SYNTAX_ERROR', source, f"Syntax error: {error}", line=find_line_number_in_text(js_content, '/*')))
+    # Dangerous patterns and deprecated APIs, single scan
+    for name, snippet in scan_js_bad(js_content):
+        issue_type, message = _JS_BAD_ISSUES[name]
+        issues.append(make_issue(issue_type, source, message, line=find_line_number_in_text(js_content, snippet), context=snippet))
+    return issues
+
+# Below this many bytes of CSS/JS, starting worker processes costs more than it saves
+PARALLEL_MIN_BYTES = 256 * 1024
+
+def map_page_analyzer(fn, jobs):
+    """Run fn(*job) for each job, across worker processes when the batch is big enough; keeps job order."""
+    if len(jobs) > 1 and sum(len(job[0]) for job in jobs) >= PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            return list(ex.map(fn, *zip(*jobs)))
+    return [fn(*job) for job in jobs]
+
 class WebsiteAnalyzer:
     def __init__(self, url, options):
         self.url = url
         self.base_url = self._get_base_url(url)
-        self.session = requests.Session()
+        self.session = self._make_session(options)
+        self.session.mount('http://', make_http_adapter())
+        self.session.mount('https://', make_http_adapter())
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; StaticAnalyzer/2.0)'
+            'User-Agent': USER_AGENT
         })
         self.issues = []
         self.options = options
@@ -947,18 +1866,63 @@ class WebsiteAnalyzer:
         self.used_selectors = set()
         self.all_links = []
         self.all_imgs = []
+        self.assets = {}
+
+    def _make_session(self, options):
+        # Opt-in on-disk cache: honours Cache-Control/ETag so re-runs mostly revalidate instead of downloading
+        if getattr(options, 'http_cache', False) and requests_cache:
+            return requests_cache.CachedSession(HTTP_CACHE_NAME, backend='sqlite', expire_after=3600, cache_control=True)
+        return requests.Session()
 
     def _get_base_url(self, url):
         return '/'.join(url.split('/')[:3])
 
+    def _absurl(self, url):
+        """Resolve an href/src like urljoin(base_url + '/', url), without reparsing plain paths."""
+        if url.startswith(('http://', 'https://')):
+            return url
+        if url.startswith('//'):
+            return self.base_url.split(':', 1)[0] + ':' + url
+        # Schemes, dot segments and padded values need the real resolver
+        if ':' in url or '/.' in '/' + url or url[:1].isspace() or url[-1:].isspace():
+            return url if is_absolute(url) else urljoin(self.base_url + '/', url)
+        return self.base_url + (url if url.startswith('/') else '/' + url)
+
     def _fetch_url(self, url):
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
+            # Streamed so an oversized body is abandoned instead of buffered whole
+            with self.session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                body = read_capped(response)
+                encoding = response.encoding or 'utf-8'
         except requests.RequestException as e:
             self.issues.append(make_issue('NETWORK_ERROR', url, str(e), line=get_line_for_network_error(self.html_content, url)))
             return None
+        if body is None:
+            self.issues.append(make_issue('NETWORK_ERROR', url, TOO_LARGE_MESSAGE, line=get_line_for_network_error(self.html_content, url)))
+            return None
+        return body.decode(encoding, errors='replace')
+
+    def _prefetch_assets(self):
+        # Download every stylesheet/script the page references at once instead of one by one.
+        # With the HTTP cache on, assets go through the cached session instead.
+        if requests_cache and isinstance(self.session, requests_cache.CachedSession):
+            return
+        urls = []
+        if self.options.css:
+            urls += [link['href'] for link in self.soup.select('link[rel~="stylesheet"][href]')]
+        if self.options.js:
+            urls += [script['src'] for script in self.soup.select('script[src]')]
+        urls = [self._absurl(url) for url in urls]
+        self.assets = fetch_assets(urls, headers=self.session.headers)
+
+    def _fetch_asset(self, url):
+        if url not in self.assets:
+            return self._fetch_url(url)
+        content, error = self.assets[url]
+        if error:
+            self.issues.append(make_issue('NETWORK_ERROR', url, error, line=get_line_for_network_error(self.html_content, url)))
+        return content
 
     def _check_robots_txt(self):
         if self.options.ignore_robots:
@@ -973,7 +1937,8 @@ class WebsiteAnalyzer:
         self.html_content = self._fetch_url(self.url)
         if not self.html_content:
             return self.issues
-        self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        self.soup = make_soup(self.html_content)
+        self._prefetch_assets()
         if self.options.html:
             self._analyze_html()
         if self.options.css:
@@ -987,220 +1952,245 @@ class WebsiteAnalyzer:
     # --- HTML Analysis ---
     def _analyze_html(self):
         soup = self.soup
+        # Bound once; the checks below append per element
+        add = self.issues.append
+        # One walk over the tree gathers what every check needs; issues are still emitted check by check
+        imgs, deprecated, interactive, inputs, headings, anchors = [], [], [], [], [], []
+        label_fors = set()
+        has_title = has_description = False
+        for el in soup.descendants:
+            if not isinstance(el, Tag):
+                continue
+            name = el.name
+            if name == 'img':
+                imgs.append(el)
+            elif name in _DEPRECATED_TAGS:
+                deprecated.append(el)
+            elif name == 'a' or name == 'button' or name == 'input':
+                interactive.append(el)
+                if name == 'input':
+                    inputs.append(el)
+                elif name == 'a' and el.has_attr('href'):
+                    anchors.append(el)
+            elif name == 'label':
+                if el.has_attr('for'):
+                    label_fors.add(el['for'])
+            elif name in _HEADING_LEVELS:
+                headings.append(_HEADING_LEVELS[name])
+            elif name == 'title':
+                has_title = True
+            elif name == 'meta' and el.get('name') == 'description':
+                has_description = True
         # Accessibility: missing alt
-        for img in soup.find_all('img'):
+        for img in imgs:
             self.all_imgs.append(img)
             if not img.get('alt'):
                 tag_str = str(img)
                 line = find_line_number_in_text(self.html_content, tag_str)
-                self.issues.append(make_issue('HTML_MISSING_ALT', self.url, "Image missing alt text", line=line, context=tag_str))
+                add(make_issue('HTML_MISSING_ALT', self.url, "Image missing alt text", line=line, context=tag_str))
         # Deprecated tags
-        deprecated_tags = ['center', 'font', 'marquee']
-        for tag in deprecated_tags:
-            for found in soup.find_all(tag):
-                self.issues.append(make_issue('HTML_DEPRECATED_TAG', self.url, f"Deprecated HTML tag <{tag}> used", line=find_line_number_in_text(self.html_content, str(found)), context=str(found)))
-        # Accessibility: missing aria
-        for el in soup.find_all(True):
-            if el.name in ['button', 'input', 'a'] and not any(attr.startswith('aria-') for attr in el.attrs):
-                self.issues.append(make_issue('HTML_MISSING_ARIA', self.url, f"<{el.name}> missing aria-* attribute", line=find_line_number_in_text(self.html_content, str(el)), context=str(el)))
+        # Each list is in document order; repeated identical tags advance through the raw HTML
+        located = {}
+        for found in deprecated:
+            line, snippet = element_locator(found, self.html_content, located)
+            add(make_issue('HTML_DEPRECATED_TAG', self.url, f"Deprecated HTML tag <{found.name}> used", line=line, context=snippet))
+        # Accessibility: missing aria (only interactive elements can need it)
+        for el in interactive:
+            if any(attr.startswith('aria-') for attr in el.attrs):
+                skip_element(el, located)
+            else:
+                line, snippet = element_locator(el, self.html_content, located)
+                add(make_issue('HTML_MISSING_ARIA', self.url, f"<{el.name}> missing aria-* attribute", line=line, context=snippet))
         # Accessibility: label/input
-        for inp in soup.find_all('input'):
-            if not inp.get('id') or not soup.find('label', attrs={'for': inp.get('id')}):
-                self.issues.append(make_issue('HTML_INPUT_NO_LABEL', self.url, "Input missing associated <label>", line=find_line_number_in_text(self.html_content, str(inp)), context=str(inp)))
+        for inp in inputs:
+            input_id = inp.get('id')
+            if not input_id or input_id not in label_fors:
+                tag_str = str(inp)
+                add(make_issue('HTML_INPUT_NO_LABEL', self.url, "Input missing associated <label>", line=find_line_number_in_text(self.html_content, tag_str), context=tag_str))
         # Accessibility: heading order
-        headings = [int(h.name[1]) for h in soup.find_all(re.compile('^h[1-6]$'))]
         if headings:
             prev = 0
             for h in headings:
                 if prev and h > prev + 1:
-                    self.issues.append(make_issue('HTML_HEADING_ORDER', self.url, "Skipped heading level", line=find_line_number_in_text(self.html_content, f"h{h}")))
+                    add(make_issue('HTML_HEADING_ORDER', self.url, "Skipped heading level", line=find_line_number_in_text(self.html_content, f"h{h}")))
                 prev = h
         # SEO: title, meta description, h1 count
-        if not soup.find('title'):
-            self.issues.append(make_issue('SEO_MISSING_TITLE', self.url, "Missing <title> tag", line=find_line_number_in_text(self.html_content, '<title>'), context='<title>'))
-        if not soup.find('meta', attrs={'name': 'description'}):
-            self.issues.append(make_issue('SEO_MISSING_DESCRIPTION', self.url, "Missing meta description", line=find_line_number_in_text(self.html_content, '<meta name="description"'), context='<meta name="description"'), context='<meta name="description"')
-        h1s = soup.find_all('h1')
-        if len(h1s) == 0:
-            self.issues.append(make_issue('SEO_MISSING_H1', self.url, "No <h1> tag found", line=find_line_number_in_text(self.html_content, '<h1>'), context='<h1>'))
-        elif len(h1s) > 1:
-            self.issues.append(make_issue('SEO_MULTIPLE_H1', self.url, "Multiple <h1> tags found", line=find_line_number_in_text(self.html_content, '<h1>'), context='<h1>'))
-        # Broken links
-        for a in soup.find_all('a', href=True):
+        if not has_title:
+            add(make_issue('SEO_MISSING_TITLE', self.url, "Missing <title> tag", line=find_line_number_in_text(self.html_content, '<title>'), context='<title>'))
+        if not has_description:
+            add(make_issue('SEO_MISSING_DESCRIPTION', self.url, "Missing meta description", line=find_line_number_in_text(self.html_content, '<meta name="description"'), context='<meta name="description"'))
+        h1_count = headings.count(1)
+        if h1_count == 0:
+            add(make_issue('SEO_MISSING_H1', self.url, "No <h1> tag found", line=find_line_number_in_text(self.html_content, '<h1>'), context='<h1>'))
+        elif h1_count > 1:
+            add(make_issue('SEO_MULTIPLE_H1', self.url, "Multiple <h1> tags found", line=find_line_number_in_text(self.html_content, '<h1>'), context='<h1>'))
+        # Broken links/images: collect every unique URL first, then HEAD them all concurrently
+        skip_hosts = getattr(self.options, 'skip_hosts', None) or ()
+        link_elems, img_elems = {}, {}
+        for a in anchors:
             href = a['href']
-            if not is_absolute(href):
-                href = urljoin(self.base_url + '/', href)
+            if is_non_http_link(href):
+                continue
+            href = self._absurl(href)
             self.all_links.append(href)
-            try:
-                r = self.session.head(href, allow_redirects=True, timeout=5)
-                if r.status_code >= 400:
-                    self.issues.append(make_issue('HTML_BROKEN_LINK', href, f"Broken link: {r.status_code}", line=find_line_number_in_text(self.html_content, str(a)), context=str(a)))
-            except Exception as e:
-                self.issues.append(make_issue('HTML_BROKEN_LINK', href, f"Broken link: {str(e)}", line=find_line_number_in_text(self.html_content, str(a)), context=str(a)))
-        for img in soup.find_all('img', src=True):
+            if not is_skipped_host(href, skip_hosts):
+                link_elems.setdefault(href, []).append(a)
+        for img in imgs:
+            if not img.has_attr('src'):
+                continue
             src = img['src']
-            if not is_absolute(src):
-                src = urljoin(self.base_url + '/', src)
-            try:
-                r = self.session.head(src, allow_redirects=True, timeout=5)
-                if r.status_code >= 400:
-                    self.issues.append(make_issue('HTML_BROKEN_IMG', src, f"Broken image: {r.status_code}", line=find_line_number_in_text(self.html_content, str(img)), context=str(img)))
-            except Exception as e:
-                self.issues.append(make_issue('HTML_BROKEN_IMG', src, f"Broken image: {str(e)}", line=find_line_number_in_text(self.html_content, str(img)), context=str(img)))
+            if is_non_http_link(src):
+                continue
+            src = self._absurl(src)
+            if not is_skipped_host(src, skip_hosts):
+                img_elems.setdefault(src, []).append(img)
+        results = check_urls(link_elems.keys() | img_elems.keys(), headers=self.session.headers)
+        for kind, label, elems in (('HTML_BROKEN_LINK', 'Broken link', link_elems), ('HTML_BROKEN_IMG', 'Broken image', img_elems)):
+            for url, found in elems.items():
+                status, error = results[url]
+                if error or status >= 400:
+                    tag_str = str(found[0])
+                    add(make_issue(kind, url, broken_message(label, status, error, found), line=find_line_number_in_text(self.html_content, tag_str), context=tag_str))
 
     # --- CSS Analysis ---
     def _analyze_styles(self):
         soup = self.soup
+        jobs = []
         # External CSS
-        for link in soup.find_all('link', rel='stylesheet'):
+        for link in soup.select('link[rel~="stylesheet"][href]'):
             href = link['href']
-            css_url = href if is_absolute(href) else urljoin(self.base_url + '/', href)
-            css_content = self._fetch_url(css_url)
+            css_url = self._absurl(href)
+            css_content = self._fetch_asset(css_url)
             if css_content:
                 self.external_css.append((css_url, css_content))
-                self._analyze_css(css_content, css_url)
+                jobs.append((css_content, css_url, True))
         # Inline CSS
         for style in soup.find_all('style'):
             if style.string:
-                self._analyze_css(style.string, self.url)
-        # Inline styles in HTML
-        inline_style_pattern = re.compile(r'style="([^"]*)"')
-        for match in inline_style_pattern.findall(self.html_content):
-            self._analyze_css(match, self.url)
+                jobs.append((str(style.string), self.url, False))
+        depth = self.options.max_selector_depth
+        candidates = []
+        results = map_page_analyzer(analyze_page_css, [(css, source, depth, external) for css, source, external in jobs])
+        for (css, source, external), (issues, selectors, rules) in zip(jobs, results):
+            self.issues.extend(issues)
+            self.used_selectors.update(selectors)
+            # Simple selectors of external sheets, collected during the same parse
+            candidates += [(selector, source, line, rule_text) for selector, line, rule_text in rules]
+        # Inline styles in HTML: declarations only, so they get one batched parse of their own
+        self.issues.extend(analyze_inline_styles([el['style'] for el in soup.find_all(style=True)], self.html_content, self.url))
         # Unused selectors
-        self._check_unused_selectors()
-
-    def _analyze_css(self, css_content, source):
-        try:
-            sheet = cssutils.parseString(css_content)
-            selectors_seen = set()
-            for rule in sheet:
-                if rule.type == CSSRule.STYLE_RULE:
-                    # !important
-                    for prop in rule.style:
-                        if '!important' in prop.value:
-                            self.issues.append(make_issue('CSS_IMPORTANT_OVERUSE', source, "Use of !important in CSS", line=find_line_number_in_text(css_content, '/*')))
-                    # Selector depth
-                    selector = rule.selectorText
-                    if self.options.max_selector_depth is not None:
-                        depth = max(selector.count(' '), selector.count('>'))
-                        if depth > self.options.max_selector_depth:
-                            self.issues.append(make_issue('CSS_COMPLEX_SELECTOR', source, f"Overly complex selector: {selector}", line=find_line_number_in_text(css_content, str(rule)), context=str(rule)))
-                    # Vendor prefix
-                    for prop in rule.style:
-                        if prop.name.startswith('-webkit-') or prop.name.startswith('-moz-') or prop.name.startswith('-ms-'):
-                            if not prop.name.startswith('--'):
-                                self.issues.append(make_issue('CSS_VENDOR_PREFIX', source, f"Vendor prefix used: {prop.name}", line=find_line_number_in_text(css_content, str(rule)), context=str(rule)))
-                    # Duplicate selectors
-                    if selector in selectors_seen:
-                        self.issues.append(make_issue('CSS_DUPLICATE_SELECTOR', source, f"Duplicate selector: {selector}", line=find_line_number_in_text(css_content, str(rule)), context=str(rule)))
-                    selectors_seen.add(selector)
-                    # Track selectors for unused check
-                    self.used_selectors.add(selector)
-        except Exception as e:
-            self.issues.append(make_issue('CSS_PARSING_ERROR', source, f"CSS parsing error: {str(e)}", line=find_line_number_in_text(css_content, '/*')))
+        self._check_unused_selectors(candidates)
 
-    def _check_unused_selectors(self):
+    def _check_unused_selectors(self, candidates):
         # Only works for external CSS
-        html = self.html_content
-        for css_url, css_content in self.external_css:
-            try:
-                sheet = cssutils.parseString(css_content)
-                for rule in sheet:
-                    if rule.type == CSSRule.STYLE_RULE:
-                        selector = rule.selectorText
-                        # Only check simple selectors
-                        if selector and not re.search(r'[\[\]:>~+]', selector):
-                            if selector not in html:
-                                self.issues.append(make_issue('CSS_UNUSED_SELECTOR', css_url, f"Unused selector: {selector}", line=find_line_number_in_text(css_content, str(rule)), context=str(rule)))
-            except Exception:
-                pass
+        if not candidates:
+            return
+        # Tag/id/class tokens of the parsed page; selectors are matched against these, not the raw text
+        tags, ids, classes = set(), set(), set()
+        for el in self.soup.find_all(True):
+            tags.add(el.name)
+            if el.get('id'):
+                ids.add(el['id'])
+            classes.update(el.get('class', ()))
+        add = self.issues.append
+        for selector, css_url, line, rule_text in candidates:
+            if not selector_matches(selector, tags, ids, classes):
+                add(make_issue('CSS_UNUSED_SELECTOR', css_url, f"Unused selector: {selector}", line=line, context=rule_text))
 
     # --- JS Analysis ---
     def _analyze_scripts(self):
         soup = self.soup
+        jobs = []
         # External scripts
-        for script in soup.find_all('script', src=True):
+        for script in soup.select('script[src]'):
             src = script['src']
-            js_url = src if is_absolute(src) else urljoin(self.base_url + '/', src)
-            js_content = self._fetch_url(js_url)
+            js_url = self._absurl(src)
+            js_content = self._fetch_asset(js_url)
             if js_content:
                 self.external_js.append((js_url, js_content))
-                self._analyze_javascript(js_content, js_url)
+                jobs.append((js_content, js_url))
         # Inline scripts
-        for script in soup.find_all('script', src=False):
+        for script in soup.select('script:not([src])'):
             if script.string:
-                self._analyze_javascript(script.string, self.url)
+                jobs.append((str(script.string), self.url))
+        for issues in map_page_analyzer(analyze_page_js, jobs):
+            self.issues.extend(issues)
         # Inline event handlers
-        for el in soup.find_all(True):
-            for attr in el.attrs:
-                if attr.startswith('on'):
-                    self.issues.append(make_issue('JS_INLINE_EVENT_HANDLER', self.url, f"Inline event handler: {attr}", line=find_line_number_in_text(self.html_content, str(el)), context=str(el)))
+        add = self.issues.append
+        for tag, attr, value in self._iter_attributes():
+            if attr.startswith('on'):
+                snippet = f'{attr}="{value}"'
+                add(make_issue('JS_INLINE_EVENT_HANDLER', self.url, f"Inline event handler: {attr}", line=find_line_number_in_text(self.html_content, snippet), context=f'<{tag} {snippet}>'))
         # ESLint integration (optional)
         if self.options.eslint and subprocess:
             for js_url, js_content in self.external_js:
                 self._eslint_check(js_content, js_url)
 
-    def _analyze_javascript(self, js_content, source):
-        try:
-            pyjsparser.parse(js_content)
-        except Exception as e:
-            self.issues.append(make_issue('JS_SYNTAX_ERROR', source, f"Syntax error: {str(e)}", line=find_line_number_in_text(js_content, '/*')))
-        # Dangerous patterns
-        dangerous_patterns = {
-            'eval': r'\beval\s*\(',
-            'innerHTML': r'\.innerHTML\s*=',
-            'document.write': r'document\.write\s*\('
-        }
-        for pattern_name, pattern in dangerous_patterns.items():
-            for match in re.finditer(pattern, js_content):
-                line = find_line_number_in_text(js_content, match.group(0))
-                snippet = match.group(0)
-                self.issues.append(make_issue('JS_DANGEROUS_FUNCTION', source, f"Use of {pattern_name} detected", line=line, context=snippet))
-        # Deprecated APIs
-        deprecated_apis = ['escape(', 'unescape(', 'document.all', 'document.layers']
-        for api in deprecated_apis:
-            for match in re.finditer(api, js_content):
-                line = find_line_number_in_text(js_content, match.group(0))
-                snippet = match.group(0)
-                self.issues.append(make_issue('JS_DEPRECATED_API', source, f"Deprecated API used: {api}", line=line, context=snippet))
+    def _iter_attributes(self):
+        """Yield (tag, attribute, value) for every element attribute in the page."""
+        if LexborHTMLParser:
+            # Whole-document attribute walk in C; bs4 is kept for everything else
+            for node in LexborHTMLParser(self.html_content).css('*'):
+                for attr, value in node.attributes.items():
+                    yield node.tag, attr, value
+        else:
+            for el in self.soup.find_all(True):
+                for attr, value in el.attrs.items():
+                    yield el.name, attr, value
 
     def _eslint_check(self, js_content, source):
+        add = self.issues.append
         try:
-            with open('temp_eslint.js', 'w', encoding='utf-8') as f:
-                f.write(js_content)
-            result = subprocess.run(['eslint', 'temp_eslint.js', '-f', 'json'], capture_output=True, text=True)
+            # Lint from stdin; the file name only picks the parser/config, so keep it a plain .js name
+            filename = os.path.basename(urlparse(source).path) or 'inline.js'
+            if not filename.endswith('.js'):
+                filename += '.js'
+            result = subprocess.run([ESLINT, '--stdin', '--stdin-filename', filename, '-f', 'json'],
+                                    input=js_content.encode('utf-8'), capture_output=True)
             if result.returncode != 0 and result.stdout:
-                eslint_issues = json.loads(result.stdout)
+                eslint_issues = _json_loads(result.stdout)
                 for file_issues in eslint_issues:
                     for msg in file_issues.get('messages', []):
-                        self.issues.append(make_issue('JS_ESLINT', source, f"{msg.get('message')} (rule: {msg.get('ruleId')})", line=find_line_number_in_text(js_content, msg.get('line'))))
-            os.remove('temp_eslint.js')
+                        add(make_issue('JS_ESLINT', source, f"{msg.get('message')} (rule: {msg.get('ruleId')})", line=msg.get('line'), column=msg.get('column')))
         except Exception as e:
-            self.issues.append(make_issue('JS_ESLINT_ERROR', source, f"ESLint error: {str(e)}", line=find_line_number_in_text(js_content, '/*')))
+            add(make_issue('JS_ESLINT_ERROR', source, f"ESLint error: {str(e)}", line=find_line_number_in_text(js_content, '/*')))
 
     # --- Performance & Security ---
     def _analyze_perfsec(self):
+        add = self.issues.append
         # Large files
         for url, content in self.external_css + self.external_js:
             if len(content) > 100*1024:
-                self.issues.append(make_issue('PERF_LARGE_FILE', url, f"File size > 100KB ({len(content)} bytes)", line=find_line_number_in_text(content, '/*')))
+                add(make_issue('PERF_LARGE_FILE', url, f"File size > 100KB ({len(content)} bytes)", line=find_line_number_in_text(content, '/*')))
         # Insecure requests
         for url, _ in self.external_css + self.external_js:
             if url.startswith('http://'):
-                self.issues.append(make_issue('SEC_INSECURE_REQUEST', url, "Insecure HTTP resource", line=find_line_number_in_text(self.html_content, '/*')))
+                add(make_issue('SEC_INSECURE_REQUEST', url, "Insecure HTTP resource", line=find_line_number_in_text(self.html_content, '/*')))
         # Inline scripts/styles
-        for script in self.soup.find_all('script', src=False):
+        for script in self.soup.select('script:not([src])'):
             if script.string and len(script.string) > 100:
-                self.issues.append(make_issue('SEC_INLINE_SCRIPT', self.url, "Large inline script detected", line=find_line_number_in_text(self.html_content, str(script)), context=str(script)))
+                tag_str = str(script)
+                add(make_issue('SEC_INLINE_SCRIPT', self.url, "Large inline script detected", line=find_line_number_in_text(self.html_content, tag_str), context=tag_str))
         for style in self.soup.find_all('style'):
             if style.string and len(style.string) > 100:
-                self.issues.append(make_issue('SEC_INLINE_STYLE', self.url, "Large inline style detected", line=find_line_number_in_text(self.html_content, str(style)), context=str(style)))
+                tag_str = str(style)
+                add(make_issue('SEC_INLINE_STYLE', self.url, "Large inline style detected", line=find_line_number_in_text(self.html_content, tag_str), context=tag_str))
+
+# --- Multi-page analysis ---
+PAGE_WORKERS = 8
+
+def analyze_websites(urls, options):
+    """Analyze several pages at once; issues are returned in the order the URLs were given."""
+    # Each page spends most of its time waiting on the network (its own asyncio batches),
+    # so overlapping pages on threads keeps the connection pool busy
+    with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(urls))) as ex:
+        results = list(ex.map(lambda url: WebsiteAnalyzer(url, options).analyze(), urls))
+    return [issue for issues in results for issue in issues]
 
 # --- CLI ---
 def main():
     parser = argparse.ArgumentParser(description='Static Website Code Analyzer')
-    parser.add_argument('url', nargs='?', help='URL of the website to analyze')
+    parser.add_argument('url', nargs='*', help='URL(s) of the website pages to analyze')
     parser.add_argument('--repo', help='GitHub repository URL to analyze')
     parser.add_argument('--output', choices=['plain', 'json', 'html', 'csv', 'markdown'], default='plain', help='Output format')
     parser.add_argument('--ignore-robots', action='store_true', help='Ignore robots.txt restrictions')
@@ -1210,6 +2200,10 @@ def main():
     parser.add_argument('--no-js', action='store_true', help='Disable JS checks')
     parser.add_argument('--no-perfsec', action='store_true', help='Disable performance/security checks')
     parser.add_argument('--eslint', action='store_true', help='Enable ESLint integration (requires Node.js)')
+    parser.add_argument('--http-cache', action='store_true', help='Cache fetched pages/assets (requires requests-cache) and link check results on disk')
+    parser.add_argument('--skip-host', action='append', default=[], metavar='HOST', help='Do not probe links/images on HOST or its subdomains (repeatable)')
+    parser.add_argument('--max-file-bytes', type=int, default=MAX_FILE_BYTES, help='Skip repository files larger than this many bytes')
+    parser.add_argument('--skip-dirs', default='', metavar='DIRS', help='Comma-separated extra directory names to skip in repositories')
     args = parser.parse_args()
     class Opt:
         html = not args.no_html
@@ -1219,12 +2213,18 @@ def main():
         ignore_robots = args.ignore_robots
         max_selector_depth = args.max_selector_depth
         eslint = args.eslint
+        http_cache = args.http_cache
+        skip_hosts = tuple(h.lower() for h in args.skip_host)
+        max_file_bytes = args.max_file_bytes
+        skip_dirs = SKIP_DIRS | {d.strip() for d in args.skip_dirs.split(',') if d.strip()}
+    install_dns_cache()
+    if args.http_cache:
+        enable_head_db()
     if args.repo:
         issues = analyze_github_repo(args.repo, Opt)
         generate_report(issues, output_format=args.output)
     elif args.url:
-        analyzer = WebsiteAnalyzer(args.url, Opt)
-        issues = analyzer.analyze()
+        issues = analyze_websites(args.url, Opt)
         generate_report(issues, output_format=args.output)
     else:
         parser.print_help()